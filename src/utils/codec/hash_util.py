@@ -4,10 +4,37 @@
 Description: Hash Utility Class Source Code.
 """
 import hashlib
+import mmap
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Union
+
+# Files at least this large are hashed through a read-only memory map, and in a thread pool when hashing a directory.
+# Smaller files are read in one call: hashlib keeps the GIL for small updates, so threads would not help them.
+_LARGE_FILE_THRESHOLD = 1024 * 1024
 
 
 class HashUtil:
+    @staticmethod
+    def _hash_file(file_path: str, hash_algorithm: str):
+        """
+        Hash the content of a file, small files with a single read and large files without copying their content.
+
+        Args:
+            file_path (str): The path of the file to be hashed.
+            hash_algorithm (str): The hashing algorithm to use.
+
+        Returns:
+            The hash object updated with the entire file content.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _LARGE_FILE_THRESHOLD:
+                return hashlib.new(hash_algorithm, f.read())
+            file_hash = hashlib.new(hash_algorithm)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                file_hash.update(mm)
+            return file_hash
+
     @staticmethod
     def calculate_file_hash_digest(file_path: str, hash_algorithm='md5') -> bytes:
         """
@@ -26,13 +53,8 @@ class HashUtil:
         if not os.path.isfile(file_path):
             raise ValueError(f"The specified path is not a file: {file_path}")
 
-        # Hash the content of each file
-        with open(file_path, 'rb', encoding="utf-8") as f:
-            file_hash = hashlib.new(hash_algorithm)
-            while chunk := f.read(8192):  # Read file in chunks
-                file_hash.update(chunk)
-            # Return the final hash as digest bytes
-            return file_hash.digest()
+        # Return the final hash as digest bytes
+        return HashUtil._hash_file(file_path, hash_algorithm).digest()
 
     @staticmethod
     def calculate_file_hash(file_path: str, hash_algorithm='md5') -> str:
@@ -52,13 +74,8 @@ class HashUtil:
         if not os.path.isfile(file_path):
             raise ValueError(f"The specified path is not a file: {file_path}")
 
-        # Hash the content of each file
-        with open(file_path, 'rb') as file:
-            file_hash = hashlib.new(hash_algorithm)
-            while chunk := file.read(8192):  # Read file in chunks
-                file_hash.update(chunk)
-            # Return the final hash as a hexadecimal string
-            return file_hash.hexdigest()
+        # Return the final hash as a hexadecimal string
+        return HashUtil._hash_file(file_path, hash_algorithm).hexdigest()
 
     @staticmethod
     def calculate_directory_hash(dir_path: str, hash_algorithm='md5') -> str:
@@ -81,14 +98,34 @@ class HashUtil:
         # Create a hash object
         hash_func = hashlib.new(hash_algorithm)
 
-        # Collect all files in the directory recursively
-        for dir_path, dir_names, filenames in os.walk(dir_path):
-            for filename in sorted(filenames):  # Sort files to ensure consistent hash order
-                file_path = os.path.join(dir_path, filename)
-                # Hash the content of each file
-                file_hash_digest = HashUtil.calculate_file_hash_digest(file_path, hash_algorithm)
-                # Update the overall directory hash with the file hash
-                hash_func.update(file_hash_digest)
+        # Collect all files in the directory recursively, sorted by relative path to ensure consistent hash order,
+        # every path starts with dir_path so sorting the full paths gives the same order
+        file_paths = sorted(
+            os.path.join(root, filename) for root, _, filenames in os.walk(dir_path) for filename in filenames
+        )
+
+        # Small files are hashed in place, only large files are handed to a thread pool created on demand,
+        # hashlib releases the GIL while hashing large buffers
+        file_hash_digests: List[Union[bytes, Future]] = []
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            for file_path in file_paths:
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size < _LARGE_FILE_THRESHOLD:
+                        file_hash_digests.append(hashlib.new(hash_algorithm, f.read()).digest())
+                        continue
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+                file_hash_digests.append(executor.submit(
+                    lambda path: HashUtil._hash_file(path, hash_algorithm).digest(), file_path
+                ))
+
+            # Update the overall directory hash with the file hashes, in the sorted order
+            for file_hash_digest in file_hash_digests:
+                hash_func.update(file_hash_digest if isinstance(file_hash_digest, bytes) else file_hash_digest.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         # Return the final hash as a hexadecimal string
         return hash_func.hexdigest()
@@ -3,10 +3,14 @@
 """
 Description: Compress Utility Class.
 """
+import hashlib
 import mimetypes
 import os
 import tarfile
 import zipfile
+from typing import Dict
+
+_CHUNK_SIZE = 1024 * 1024
 
 
 class CompressUtil:
@@ -86,3 +90,77 @@ class CompressUtil:
                 raise RuntimeError(f"Failed to extract tar file: {e}")
         else:
             raise NotImplementedError(f"Unsupported format: {mime_type}! Use 'zip', 'tar.gz', 'tar.bz2', or 'tar.xz'.")
+
+    @staticmethod
+    def compress_with_hashes(input_path: str, output_path: str, level: int = 5) -> Dict[str, str]:
+        """
+        Compress a file or folder into a zip file, hashing every file while its bytes are streamed into the archive
+        :param input_path: File or folder path to compress
+        :param output_path: Generated zip file path
+        :param level: Compression level (0[No compression] - 9[Maximum compression])
+        :return: Mapping of archive member name to the SHA-256 hex digest of its content
+        """
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input path does not exist: {input_path}")
+
+        if os.path.isdir(input_path):
+            members = [
+                (os.path.join(root, file), os.path.relpath(os.path.join(root, file), input_path))
+                for root, _, files in os.walk(input_path) for file in files
+            ]
+        else:
+            members = [(input_path, os.path.basename(input_path))]
+
+        hashes: Dict[str, str] = {}
+        try:
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=level) as f:
+                for file_path, arc_name in members:
+                    info = zipfile.ZipInfo.from_file(file_path, arc_name)
+                    # Same as ZipFile.write, from_file leaves the level unset and open() would use the zlib default
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    info._compresslevel = level
+                    digest = hashlib.sha256()
+                    with open(file_path, 'rb') as src, \
+                            f.open(info, 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dst:
+                        while chunk := src.read(_CHUNK_SIZE):
+                            digest.update(chunk)
+                            dst.write(chunk)
+                    hashes[info.filename] = digest.hexdigest()
+        except Exception as e:
+            raise RuntimeError(f"Failed to create zip file: {e}")
+        return hashes
+
+    @staticmethod
+    def decompress_with_hashes(input_path: str, output_dir: str) -> Dict[str, str]:
+        """
+        Decompress a zip file, hashing every member while its bytes are written to the output directory
+        :param input_path: Zip file path
+        :param output_dir: Decompress target directory
+        :return: Mapping of archive member name to the SHA-256 hex digest of its content
+        """
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input path does not exist: {input_path}")
+
+        os.makedirs(output_dir, exist_ok=True)
+        real_output_dir = os.path.realpath(output_dir)
+
+        hashes: Dict[str, str] = {}
+        try:
+            with zipfile.ZipFile(input_path, 'r') as f:
+                for info in f.infolist():
+                    target_path = os.path.realpath(os.path.join(real_output_dir, info.filename))
+                    if os.path.commonpath([real_output_dir, target_path]) != real_output_dir:
+                        raise ValueError(f"Member escapes the output directory: {info.filename}")
+                    if info.is_dir():
+                        os.makedirs(target_path, exist_ok=True)
+                        continue
+                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                    digest = hashlib.sha256()
+                    with f.open(info, 'r') as src, open(target_path, 'wb') as dst:
+                        while chunk := src.read(_CHUNK_SIZE):
+                            digest.update(chunk)
+                            dst.write(chunk)
+                    hashes[info.filename] = digest.hexdigest()
+        except Exception as e:
+            raise RuntimeError(f"Failed to extract zip file: {e}")
+        return hashes
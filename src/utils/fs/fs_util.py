@@ -4,10 +4,13 @@
 Description: File System Utility Class Source Code.
 """
 import ctypes
+import functools
 import glob
 import hashlib
 import os
 import shutil
+import stat
+import sys
 import time
 from pathlib import Path
 import tempfile
@@ -17,8 +20,25 @@ from utils.framework_util import FrameworkUtil
 from utils.os_util import OsUtil
 from utils.pyinstaller_util import PyInstallerUtil
 
+if os.name == 'nt':
+    # 私有的 kernel32 实例，原型只声明一次，且不影响其他模块使用的 ctypes.windll.kernel32
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateFileW.restype = ctypes.c_void_p
+    _kernel32.CreateFileW.argtypes = (ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p,
+                                      ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p)
+    _kernel32.SetFileTime.restype = ctypes.c_int
+    _kernel32.SetFileTime.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+    _kernel32.CloseHandle.restype = ctypes.c_int
+    _kernel32.CloseHandle.argtypes = (ctypes.c_void_p,)
+
 
 class FsUtil:
+    _FILE_WRITE_ATTRIBUTES = 0x100
+    _FILE_SHARE_ALL = 0x7  # FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE
+    _OPEN_EXISTING = 3
+    _FILE_FLAG_BACKUP_SEMANTICS = 0x02000000  # 允许打开目录
+    _INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
     @staticmethod
     def get_project_root_path() -> AnyStr:
         current_dir: AnyStr = os.path.abspath(os.path.dirname(__file__))
@@ -31,7 +51,9 @@ class FsUtil:
             directory = os.path.dirname(directory)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_current_project_root_path() -> AnyStr:
+        """ 项目根目录在进程内不会变化，只查找一次 """
         current_dir: AnyStr = os.path.abspath(os.path.dirname(__file__))
         directory = current_dir
         while True:
@@ -71,18 +93,14 @@ class FsUtil:
 
     @staticmethod
     def is_empty_dir(path: str | Path):
-        path_str: str = path
-        if isinstance(path, Path):
-            path_str = str(path)
-        elif isinstance(path, str):
-            path = Path(path_str)
-        else:
+        if not isinstance(path, (str, Path)):
             raise TypeError(f"Invalid type of path: {type(path)}")
-        if not os.path.exists(path_str):
-            return False
-        if not os.path.isdir(path_str):
+        # 只读取第一个目录项即可判断，不会把整个目录列表加载到内存
+        try:
+            with os.scandir(path) as it:
+                return next(it, None) is None
+        except (FileNotFoundError, NotADirectoryError):
             return False
-        return not any(path.iterdir())
 
     @staticmethod
     def is_dir_exist_and_not_empty(path: str) -> bool:
@@ -101,18 +119,38 @@ class FsUtil:
                 return
             raise FileNotFoundError(f"Path not found: {path}")
 
+    @staticmethod
+    def _clear_read_only_and_retry(func, path: str, _) -> None:
+        """ shutil.rmtree 错误处理：清除只读属性（如 Windows 上 git 的 pack 文件）后重试 """
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+
+    @staticmethod
+    def _force_rmtree(path: str) -> None:
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=FsUtil._clear_read_only_and_retry)
+        else:
+            shutil.rmtree(path, onerror=FsUtil._clear_read_only_and_retry)
+
+    @staticmethod
+    def _force_unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except PermissionError:
+            FsUtil._clear_read_only_and_retry(os.unlink, path, None)
+
     @staticmethod
     def _force_remove_in_linux(path: str, not_exist_ok: bool = False) -> None:
         if os.path.isfile(path):
             # Remove file
-            os.remove(path)
+            FsUtil._force_unlink(path)
         elif os.path.isdir(path):
             # Try to remove empty directory
             try:
                 os.rmdir(path)
             except OSError:
                 # Remove the directory by calling "shutil.rmtree" if the directory is not empty
-                shutil.rmtree(path)
+                FsUtil._force_rmtree(path)
         else:
             if not os.path.exists(path):
                 if not_exist_ok:
@@ -138,6 +176,21 @@ class FsUtil:
         else:
             raise OSError(f"Unknown OS type")
 
+    @staticmethod
+    def force_remove_dir_entry(entry: os.DirEntry) -> None:
+        """
+        Remove an entry listed by os.scandir, read-only files included.
+
+        The entry type cached by the listing is used without following symlinks, so there is no extra stat
+        and no shell process per entry; a symlink to a directory is unlinked.
+
+        :param entry: The entry to be removed.
+        """
+        if entry.is_dir(follow_symlinks=False):
+            FsUtil._force_rmtree(entry.path)
+        else:
+            FsUtil._force_unlink(entry.path)
+
     @staticmethod
     def remove_path(path: str | Path, not_exist_ok: bool = False) -> None:
         return FsUtil.force_remove(path, not_exist_ok)
@@ -232,21 +285,31 @@ class FsUtil:
     @staticmethod
     def set_file_times(file_path, create_timestamp: float, last_modified_timestamp: float,
                        last_access_timestamp: float):
-        os.utime(file_path, (last_access_timestamp, last_modified_timestamp))
         if os.name == 'nt':  # Windows
-            file_time = create_timestamp
-            win_time = int(file_time * 10 ** 7 + 116444736000000000)
-            handle = ctypes.windll.kernel32.CreateFileW(
-                file_path, 256, 0, None, 3, 128, None
+            # 只打开一次句柄，通过一次 SetFileTime 同时写入创建、访问和修改时间
+            handle = _kernel32.CreateFileW(
+                file_path, FsUtil._FILE_WRITE_ATTRIBUTES, FsUtil._FILE_SHARE_ALL, None,
+                FsUtil._OPEN_EXISTING, FsUtil._FILE_FLAG_BACKUP_SEMANTICS, None
             )
-            if handle == -1:
-                raise OSError("Unable to open file set creation time")
-            c_time = ctypes.c_longlong(win_time)
-            ctypes.windll.kernel32.SetFileTime(handle, ctypes.byref(c_time), None, None)
-            ctypes.windll.kernel32.CloseHandle(handle)
+            if handle is None or handle == FsUtil._INVALID_HANDLE_VALUE:
+                raise ctypes.WinError(ctypes.get_last_error())
+            try:
+                c_time, a_time, m_time = (ctypes.c_longlong(FsUtil._to_filetime(ts)) for ts in
+                                          (create_timestamp, last_access_timestamp, last_modified_timestamp))
+                if not _kernel32.SetFileTime(handle, ctypes.byref(c_time), ctypes.byref(a_time),
+                                             ctypes.byref(m_time)):
+                    raise ctypes.WinError(ctypes.get_last_error())
+            finally:
+                _kernel32.CloseHandle(handle)
         else:
+            os.utime(file_path, (last_access_timestamp, last_modified_timestamp))
             raise RuntimeError(f'Unsupported OS type: {os.name}')
 
+    @staticmethod
+    def _to_filetime(timestamp: float) -> int:
+        """ POSIX 时间戳（秒）转换为 FILETIME（自 1601-01-01 起的 100 纳秒间隔数） """
+        return int(timestamp * 10 ** 7) + 116444736000000000
+
     @staticmethod
     def create_dirs(base_path: str, *dir_paths: str):
         """
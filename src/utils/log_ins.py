@@ -82,3 +82,14 @@ class LogUtil:
                 cls._logger.addHandler(cls.create_console_log_handle())
                 cls._logger.addHandler(file_handler)
             return cls._logger
+
+    @classmethod
+    def _reset_for_tests(cls) -> None:
+        """ 仅供测试使用：关闭并移除所有 handler，使下一次 get_logger 重新初始化 """
+        with cls._lock:
+            if cls._logger is not None:
+                for handler in list(cls._logger.handlers):
+                    cls._logger.removeHandler(handler)
+                    handler.close()
+            cls._logger = None
+            cls._log_file_path = None
@@ -4,10 +4,21 @@
 Description: Process Pool Manager Class Source Code.
 """
 
+import os
+import pickle
 import platform
-from multiprocessing import Process, Queue, set_start_method, get_start_method
-from queue import Empty
-from typing import Callable, Dict, Any, Optional
+import struct
+import time
+from multiprocessing import Lock, Process, Queue, RawValue, Semaphore, set_start_method, get_start_method
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+from typing import Callable, Dict, Any, List, Optional, Union
+
+from utils.task_pool_manager.queue_util import QueueUtil
+
+
+# Seconds between two attempts to deliver the termination signal or join a worker while stopping
+_STOP_POLL_INTERVAL = 0.1
 
 
 # Handlers (must be defined at the top level)
@@ -21,22 +32,167 @@ def math_handler(data: Dict[str, Any]) -> int:
     return data["x"] + data["y"]
 
 
+class SharedMemoryRing:
+    """
+    Bounded multi-producer/multi-consumer queue over a shared-memory ring of fixed-size slots.
+
+    Each message is pickled straight into its slot, so a put/get is a semaphore, a short
+    critical section bumping the head/tail index and one memcpy; there is no feeder thread
+    and no pipe write as with multiprocessing.Queue. It exposes the put/get subset of the
+    multiprocessing.Queue API used by ProcessPoolManager.
+
+    A message too large for a slot is passed through an overflow multiprocessing.Queue, its
+    slot only holds a marker, so the ring still bounds the number of messages in flight.
+    """
+    _LEN = struct.Struct("<I")
+    _OVERFLOW_MARKER = 0xFFFFFFFF
+
+    def __init__(self, capacity: int = 1024, slot_size: int = 4096) -> None:
+        if capacity <= 0 or slot_size <= self._LEN.size:
+            raise ValueError(f"Invalid ring geometry: capacity={capacity}, slot_size={slot_size}")
+        self.capacity: int = capacity
+        self.slot_size: int = slot_size
+        self._shm: SharedMemory = SharedMemory(create=True, size=capacity * slot_size)
+        self._owner_pid: Optional[int] = os.getpid()
+        self._head = RawValue("Q", 0)
+        self._tail = RawValue("Q", 0)
+        self._lock = Lock()
+        self._items = Semaphore(0)
+        self._spaces = Semaphore(capacity)
+        self._overflow: Queue = Queue()
+
+    def __getstate__(self):
+        return (self._shm.name, self.capacity, self.slot_size,
+                self._head, self._tail, self._lock, self._items, self._spaces, self._overflow)
+
+    def __setstate__(self, state) -> None:
+        (name, self.capacity, self.slot_size, self._head, self._tail,
+         self._lock, self._items, self._spaces, self._overflow) = state
+        self._shm = SharedMemory(name=name)
+        self._owner_pid = None  # Attached in a worker, the segment is released by the creator only
+
+    def put(self, obj: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Put an object into the ring, raise queue.Full if no slot frees up in time."""
+        payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        if not self._spaces.acquire(block, timeout):
+            raise Full
+        with self._lock:
+            offset = (self._tail.value % self.capacity) * self.slot_size
+            if len(payload) > self.slot_size - self._LEN.size:
+                # One overflow payload per marker, a consumer reading the marker takes one from the queue
+                self._overflow.put(payload)
+                self._LEN.pack_into(self._shm.buf, offset, self._OVERFLOW_MARKER)
+            else:
+                self._LEN.pack_into(self._shm.buf, offset, len(payload))
+                start = offset + self._LEN.size
+                self._shm.buf[start:start + len(payload)] = payload
+            self._tail.value += 1
+        self._items.release()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return an object from the ring, raise queue.Empty on timeout."""
+        if not self._items.acquire(block, timeout):
+            raise Empty
+        with self._lock:
+            payload = self._read_slot_within_lock()
+        self._spaces.release()
+        return pickle.loads(payload)
+
+    def get_many(self, n: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to n objects, reading every available one under a single lock acquisition.
+
+        Waits for stragglers until the timeout (for the whole call) expires; returns fewer than n objects then.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        objs: List[Any] = []
+        while len(objs) < n:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._items.acquire(True, remaining):
+                break
+            count = 1
+            while count < n - len(objs) and self._items.acquire(False):
+                count += 1
+            with self._lock:
+                payloads = [self._read_slot_within_lock() for _ in range(count)]
+            for _ in range(count):
+                self._spaces.release()
+            objs.extend(pickle.loads(payload) for payload in payloads)
+        return objs
+
+    def _read_slot_within_lock(self) -> bytes:
+        """Copy the payload out of the head slot and advance the head, the caller holds the lock."""
+        offset = (self._head.value % self.capacity) * self.slot_size
+        (length,) = self._LEN.unpack_from(self._shm.buf, offset)
+        self._head.value += 1
+        if length == self._OVERFLOW_MARKER:
+            # Published before the marker, only the feeder thread of the producer may still be delivering it
+            return self._overflow.get()
+        start = offset + self._LEN.size
+        return bytes(self._shm.buf[start:start + length])
+
+    def close(self) -> None:
+        """Detach from the shared memory, the creator also releases the segment."""
+        if self._shm is None:
+            return
+        if self._owner_pid == os.getpid():
+            self._overflow.close()
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+        self._shm = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
 class ProcessPoolManager:
-    def __init__(self, num_workers: int = 2) -> None:
+    def __init__(self, num_workers: int = 2, ring_capacity: int = 0, ring_slot_size: int = 4096) -> None:
+        """
+        :param num_workers: Number of worker processes.
+        :param ring_capacity: Transport the messages through SharedMemoryRing of this many slots;
+            0 (default) uses unbounded multiprocessing.Queue.
+        :param ring_slot_size: Slot size in bytes of the rings, larger messages take the overflow path.
+        """
         self.num_workers: int = num_workers
-        self.request_queue: Queue = Queue()
-        self.response_queue: Queue = Queue()
+        self.ring_capacity: int = ring_capacity
+        self.ring_slot_size: int = ring_slot_size
+        self.request_queue: Union[Queue, SharedMemoryRing, None] = None
+        self.response_queue: Union[Queue, SharedMemoryRing, None] = None
+        self._create_transport()
         self.handlers: Dict[str, Callable[[Any], Any]] = {}
         self.pool: list[Process] = []
         self.task_id: int = 0
         self.stopped: bool = False
 
+    def _create_transport(self) -> None:
+        if self.ring_capacity > 0:
+            self.request_queue = SharedMemoryRing(self.ring_capacity, self.ring_slot_size)
+            self.response_queue = SharedMemoryRing(self.ring_capacity, self.ring_slot_size)
+        else:
+            self.request_queue = Queue()
+            self.response_queue = Queue()
+
+    def _discard_responses(self) -> None:
+        """Drop the responses available now, so that workers blocked on a full transport can move on."""
+        try:
+            while True:
+                self.response_queue.get(block=False)
+        except Empty:
+            pass
+
     def register_handler(self, message_type: str, handler: Callable[[Any], Any]) -> None:
         """Register a handler for a specific message type."""
         self.handlers[message_type] = handler
 
     def start_workers(self) -> None:
         """Start worker processes."""
+        if self.request_queue is None:
+            # The rings are released when the workers are stopped
+            self._create_transport()
         self.stopped = False
         for _ in range(self.num_workers):
             process = Process(
@@ -47,16 +203,39 @@ class ProcessPoolManager:
             self.pool.append(process)
 
     def stop_workers(self) -> None:
-        """Stop all worker processes."""
-        for _ in range(len(self.pool)):
-            self.request_queue.put(None)  # Send termination signal
+        """
+        Stop all worker processes, then release the shared memory of the ring transport.
+
+        Responses not retrieved yet are discarded whenever a worker is stuck on a full transport,
+        otherwise the termination signal could never be delivered and the workers never exit.
+        """
+        pending_signals = len(self.pool)
+        while pending_signals:
+            try:
+                self.request_queue.put(None, timeout=_STOP_POLL_INTERVAL)  # Send termination signal
+                pending_signals -= 1
+            except Full:
+                self._discard_responses()
         for process in self.pool:
-            process.join()
+            process.join(_STOP_POLL_INTERVAL)
+            while process.is_alive():
+                self._discard_responses()
+                process.join(_STOP_POLL_INTERVAL)
         self.pool.clear()
         self.stopped = True
 
-    def send_request(self, message: Dict[str, Any]) -> None:
-        """Send a request to the worker pool."""
+        if isinstance(self.request_queue, SharedMemoryRing):
+            self.request_queue.close()
+            self.response_queue.close()
+            self.request_queue = self.response_queue = None
+
+    def send_request(self, message: Dict[str, Any], timeout: Optional[float] = None) -> None:
+        """
+        Send a request to the worker pool.
+
+        :param message: Request with 'type' and 'data' fields.
+        :param timeout: Seconds to wait for room in a bounded ring transport, raise queue.Full then; None waits.
+        """
         if self.stopped or not self.pool:
             raise RuntimeError("Cannot send request: worker processes are not running.")
         if "type" not in message or "data" not in message:
@@ -66,7 +245,7 @@ class ProcessPoolManager:
 
         self.task_id += 1
         message["id"] = self.task_id  # Assign a unique task ID
-        self.request_queue.put(message)
+        self.request_queue.put(message, timeout=timeout)
 
     def get_response(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """Retrieve a response from the response queue."""
@@ -75,8 +254,14 @@ class ProcessPoolManager:
         except Empty:
             return None
 
+    def get_responses(self, n: int, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Retrieve up to n responses, fewer if the timeout for the whole call expires, see QueueUtil.get_many."""
+        return QueueUtil.get_many(self.response_queue, n, timeout)
+
     @staticmethod
-    def worker_function(request_queue: Queue, response_queue: Queue, handlers: Dict[str, Callable[[Any], Any]]) -> None:
+    def worker_function(request_queue: Union[Queue, SharedMemoryRing],
+                        response_queue: Union[Queue, SharedMemoryRing],
+                        handlers: Dict[str, Callable[[Any], Any]]) -> None:
         """Worker process function to handle requests."""
         while True:
             try:
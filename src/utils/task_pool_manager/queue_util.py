@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Queue Utility Class Source Code.
+"""
+
+import time
+from queue import Empty
+from typing import Any, List, Optional
+
+
+class QueueUtil:
+    @staticmethod
+    def get_many(queue: Any, n: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Retrieve up to n items from a queue, fewer if the timeout for the whole call expires.
+
+        A queue exposing its own `get_many(n, timeout)`, such as SharedMemoryRing, reads the available items under
+        one lock acquisition. Any other queue (queue.Queue, multiprocessing.Queue) is drained through its public
+        API: a blocking get for the first item, then get_nowait for whatever is already queued, which still takes
+        the queue's lock once per item.
+
+        :param queue: Queue to read from.
+        :param n: Maximum number of items to return.
+        :param timeout: Seconds to wait for the whole call, None waits until n items are retrieved.
+        :return: Retrieved items in queue order.
+        """
+        get_many = getattr(queue, "get_many", None)
+        if get_many is not None:
+            return get_many(n, timeout=timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        items: List[Any] = []
+        while len(items) < n:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                items.append(queue.get(timeout=remaining))
+                while len(items) < n:
+                    items.append(queue.get_nowait())
+            except Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+        return items
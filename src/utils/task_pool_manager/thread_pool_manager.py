@@ -7,7 +7,9 @@ Description: Thread Pool Manager Class Source Code.
 from concurrent.futures import ThreadPoolExecutor, Future
 from queue import Queue, Empty
 from threading import Lock
-from typing import Callable, Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
+
+from utils.task_pool_manager.queue_util import QueueUtil
 
 
 class ThreadPoolManager:
@@ -61,6 +63,10 @@ class ThreadPoolManager:
         except Empty:
             return None
 
+    def get_responses(self, n: int, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Retrieve up to n responses, fewer if the timeout for the whole call expires, see QueueUtil.get_many."""
+        return QueueUtil.get_many(self.response_queue, n, timeout)
+
     def shutdown(self) -> None:
         """Shut down the thread pool."""
         self.executor.shutdown(wait=True)
@@ -4,6 +4,8 @@
 Description: Git Committer Grouped By Modified Time.
 """
 import os
+import posixpath
+import re
 import sys
 import time
 
@@ -18,6 +20,8 @@ logger = LogUtil.get_logger()
 
 class ModifyTimeGroupedCommitter:
     """Git Committer Grouped By Modified Time."""
+    # Above this number of excluded directories, walking the parents of a path is cheaper than the regex alternation
+    EXCLUDE_DIRS_REGEX_MAX: int = 32
 
     def __init__(self, repo_path: str, time_diff_sec: float = 3600.0,
                  exclude_files: list[str] = None, exclude_dirs: list[str] = None,
@@ -43,6 +47,55 @@ class ModifyTimeGroupedCommitter:
         self._file_path_modify_time_list: Optional[list[tuple[str, float]]] = []
         self._grouped_files: list[list[tuple[str, float]]] = []
 
+    @staticmethod
+    def compile_exclude_dirs(exclude_dirs: set) -> Optional[re.Pattern | frozenset[str]]:
+        """
+        Build a matcher of any path below the excluded directories.
+
+        A few directories are compiled into one anchored pattern, many directories are kept in a set
+        whose membership is checked for each parent of a path, O(depth) instead of O(len(exclude_dirs)).
+
+        Args:
+            exclude_dirs (set): A set of directory paths relative to the repository root.
+
+        Returns:
+            Optional[re.Pattern | frozenset[str]]: The matcher, None if there is no directory to exclude.
+        """
+        # Git reports paths with "/" separators whatever the platform is
+        dirs = {d.replace(os.sep, "/").strip("/") for d in exclude_dirs} - {""}
+        if not dirs:
+            return None
+        if len(dirs) > ModifyTimeGroupedCommitter.EXCLUDE_DIRS_REGEX_MAX:
+            return frozenset(dirs)
+        return re.compile("^(?:" + "|".join(re.escape(d) for d in sorted(dirs)) + ")/")
+
+    @staticmethod
+    def should_include(file: str, exclude_files: frozenset,
+                       exclude_dirs_matcher: Optional[re.Pattern | frozenset[str]]) -> bool:
+        """
+        Check whether a changed file is out of the excluded files and directories.
+
+        Args:
+            file (str): The file path relative to the repository root, as reported by Git.
+            exclude_files (frozenset): A set of file paths to exclude.
+            exclude_dirs_matcher (Optional[re.Pattern | frozenset[str]]): The matcher built by `compile_exclude_dirs`.
+
+        Returns:
+            bool: True if the file should be committed.
+        """
+        if file in exclude_files:
+            return False
+        if exclude_dirs_matcher is None:
+            return True
+        if isinstance(exclude_dirs_matcher, frozenset):
+            parent = posixpath.dirname(file)
+            while parent:
+                if parent in exclude_dirs_matcher:
+                    return False
+                parent = posixpath.dirname(parent)
+            return True
+        return exclude_dirs_matcher.match(file) is None
+
     @staticmethod
     def get_repo_changes_files(repo_path: str,
                                exclude_files: set, exclude_dirs: set) -> Optional[list[tuple[str, float]]]:
@@ -66,12 +119,15 @@ class ModifyTimeGroupedCommitter:
             changes_files = modified_files + untracked_files
         logger.debug("Collect changes from repo success, elapsed time: %.3f seconds.", time.time() - start_time)
 
+        exclude_files = frozenset(exclude_files)
+        exclude_dirs_matcher = ModifyTimeGroupedCommitter.compile_exclude_dirs(exclude_dirs)
+
         file_list = []
         for file in changes_files:
             file_abs_path = os.path.join(repo_path, file)
 
             # Exclude files or directories
-            if file in exclude_files or os.path.dirname(file) in exclude_dirs:
+            if not ModifyTimeGroupedCommitter.should_include(file, exclude_files, exclude_dirs_matcher):
                 continue
 
             try:
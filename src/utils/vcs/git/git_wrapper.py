@@ -29,17 +29,13 @@ class GitWrapper:
             raise FileNotFoundError(f"Directory does not exist: {dir_path}")
 
         try:
-            for entry in os.scandir(dir_path):
-                if entry.is_dir():
-                    # Keep .git folder
-                    if entry.name == ".git":
+            # The entry type comes from the directory listing itself, no extra stat per entry
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    # Keep .git folder and .gitignore files
+                    if entry.name == (".git" if entry.is_dir(follow_symlinks=False) else ".gitignore"):
                         continue
-                    FsUtil.force_remove(entry.path)
-                elif entry.is_file():
-                    # Keep .gitignore files
-                    if entry.name == ".gitignore":
-                        continue
-                    FsUtil.force_remove(entry.path)
+                    FsUtil.force_remove_dir_entry(entry)
         except Exception as e:
             logger.exception(f"Error while cleaning directory: %s. Exception: %s.", dir_path, e)
 
@@ -3,6 +3,8 @@
 """
 Description: Git Utility Class Source Code.
 """
+import concurrent.futures
+import functools
 import os
 import subprocess
 import sys
@@ -13,7 +15,58 @@ from git import Repo
 from git.exc import InvalidGitRepositoryError, GitCommandError, NoSuchPathError
 
 from utils.base_util import BaseUtil
-from utils.fs.file_util import FileUtil
+
+_READ_CHUNK_SIZE: int = 64 * 1024
+_BINARY_SNIFF_SIZE: int = 8192
+_UNTRACKED_READ_MAX_WORKERS: int = 32
+
+
+def _read_text_if_not_binary(file_path: str) -> Optional[str]:
+    """
+    Reads the whole file through a single descriptor and decodes it as UTF-8, ignoring undecodable bytes.
+
+    The first chunk is sniffed for NUL bytes, so binary detection and content read share one open.
+    CRLF and CR line endings become LF, as with the universal newlines of a text-mode open.
+
+    :param file_path: Path to the file to read.
+    :return: The file content, or None if the file is binary.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        head = os.read(fd, _BINARY_SNIFF_SIZE)
+        if b"\x00" in head:
+            return None
+        chunks: list[bytes] = [head]
+        while chunk := os.read(fd, _READ_CHUNK_SIZE):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_untracked_files(repo_path: str, files: list[str]) -> list[tuple[str, Optional[str]]]:
+    """
+    Reads the untracked regular files concurrently in a thread pool, the file read calls release the GIL.
+
+    :param repo_path: Path to the Git repository.
+    :param files: File paths relative to the repository root.
+    :return: (file, content) pairs in the input order, content is None for binary files.
+    """
+    file_paths = [(file, os.path.join(repo_path, file)) for file in files]
+    file_paths = [(file, file_path) for file, file_path in file_paths if os.path.isfile(file_path)]
+    if len(file_paths) <= 1:
+        return [(file, _read_text_if_not_binary(file_path)) for file, file_path in file_paths]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_UNTRACKED_READ_MAX_WORKERS,
+                                                               len(file_paths))) as executor:
+        contents = list(executor.map(_read_text_if_not_binary, [file_path for _, file_path in file_paths]))
+    return [(file, content) for (file, _), content in zip(file_paths, contents)]
+
+
+@functools.lru_cache(maxsize=64)
+def _build_exclusions(dirs: tuple[str, ...], files: tuple[str, ...]) -> tuple[str, ...]:
+    """Builds the git pathspecs excluding the given directories and files, memoized for periodic workflows."""
+    return tuple(f":(exclude){path}" for path in dirs + files)
 
 
 class GitUtil:
@@ -37,6 +90,15 @@ class GitUtil:
         if not os.path.exists(dir_path):
             return False
 
+        # Fast path for a regular working tree, no need to open the repository
+        git_path = os.path.join(dir_path, '.git')
+        if os.path.isfile(os.path.join(git_path, 'HEAD')):
+            return True
+        # Neither a working tree nor a bare repository
+        if not os.path.exists(git_path) and not os.path.isfile(os.path.join(dir_path, 'HEAD')):
+            return False
+
+        # Edge cases: bare repository, ".git" file of worktree or submodule, broken ".git" directory
         try:
             with Repo(dir_path) as r:
                 if r.git_dir:
@@ -85,11 +147,13 @@ class GitUtil:
 
     @staticmethod
     def create_git_repository(repo_path: str) -> bool:
-        if GitUtil.is_git_repository(repo_path):
-            return False
-        os.makedirs(repo_path, exist_ok=True)
-        Repo.init(repo_path)
-        return True
+        """
+        Alias of `create_local_empty_git_repo`, kept for compatibility.
+
+        :param repo_path: Path to the directory where the Git repository should be created.
+        :return: True if the repository was created successfully, False otherwise.
+        """
+        return GitUtil.create_local_empty_git_repo(repo_path)
 
     @staticmethod
     def load_git_untracked_diff(repo_path: str, cached: bool = False) -> Optional[str]:
@@ -109,21 +173,30 @@ class GitUtil:
         return False
 
     @staticmethod
-    def get_git_last_commit_id() -> str:
+    def get_last_commit_info(repo_path: str = None) -> tuple[str, str, str]:
+        """
+        Get the ID, date and time of the latest commit with a single git process.
+
+        :param repo_path: Path to the Git repository, the current working directory if None.
+        :return: Commit ID, date formatted as YYYY-MM-DD and time formatted as YYYYmmddHHMMSS.
+        """
+        output = subprocess.check_output(['git', 'log', '-1', '--format=%H%n%cs%n%cd',
+                                          '--date=format:%Y%m%d%H%M%S'], cwd=repo_path)
+        commit_id, commit_date, commit_time = output.decode('utf-8').splitlines()[:3]
+        return commit_id, commit_date, commit_time
+
+    @staticmethod
+    def get_git_last_commit_id(repo_path: str = None) -> str:
         """Get the latest Git commit ID"""
-        return subprocess.check_output(['git', 'rev-parse', 'HEAD']).strip().decode('utf-8')
+        return GitUtil.get_last_commit_info(repo_path)[0]
 
     @staticmethod
-    def get_git_last_commit_date() -> str:
-        result = subprocess.run(['git', 'log', '-1', '--format=%cd', '--date=short'],
-                                stdout=subprocess.PIPE, text=True)
-        return result.stdout.strip()
+    def get_git_last_commit_date(repo_path: str = None) -> str:
+        return GitUtil.get_last_commit_info(repo_path)[1]
 
     @staticmethod
-    def get_git_last_commit_time():
-        result = subprocess.run(['git', 'log', '-1', '--format=%cd', '--date=format:%Y%m%d%H%M%S'],
-                                stdout=subprocess.PIPE, text=True)
-        return result.stdout.strip()
+    def get_git_last_commit_time(repo_path: str = None) -> str:
+        return GitUtil.get_last_commit_info(repo_path)[2]
 
     @staticmethod
     def export_git_diff(repo_path, output_path):
@@ -137,11 +210,12 @@ class GitUtil:
         if repo.is_dirty(untracked_files=True):  # 确保仓库有未提交更改
             print("发现未提交的更改，正在提取差异...")
 
-            # 提取暂存区（staged changes）的差异
-            staged_diff = repo.git.diff(cached=True)
-
-            # 提取工作区（unstaged changes）的差异
-            unstaged_diff = repo.git.diff()
+            # 并发提取暂存区（staged changes）和工作区（unstaged changes）的差异，两个 git 进程的等待时间重叠
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                staged_future = executor.submit(repo.git.diff, cached=True)
+                unstaged_future = executor.submit(repo.git.diff)
+                staged_diff = staged_future.result()
+                unstaged_diff = unstaged_future.result()
 
             # 将差异内容保存到文件
             with open(output_path, "w", encoding="utf-8") as diff_file:
@@ -170,30 +244,22 @@ class GitUtil:
             # 打开 Git 仓库
             repo = Repo(repo_path)
 
-            # 检查仓库状态，是否有未提交或未受版本控制的更改
-            if not repo.is_dirty(untracked_files=True):
-                return None
-
-            # 获取已版本控制文件的未提交差异
+            # 获取已版本控制文件的未提交差异和未受版本控制的文件列表，两者皆空则没有需要导出的更改
             tracked_diff = repo.git.diff()
+            untracked_files = repo.untracked_files
+            if BaseUtil.is_empty(tracked_diff) and not untracked_files:
+                return None
             if not BaseUtil.is_empty(tracked_diff):
                 tracked_diff = "# Tracked diff\r\n" + tracked_diff
 
-            # 获取未受版本控制的文件列表
-            untracked_files = repo.untracked_files
-
             # 准备未受版本控制文件的差异内容
-            untracked_diff = ""
-            for file in untracked_files:
-                file_path = os.path.join(repo_path, file)
-                if os.path.isfile(file_path):
-                    if FileUtil.is_binary_file(file_path):
-                        untracked_diff += f"\n\n--- {file} (untracked, binary) ---"
-                    else:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        untracked_diff += f"\n\n--- {file} (untracked) ---\n{content}"
-            untracked_diff = "# Untracked files content\r\n" + untracked_diff
+            untracked_parts: list[str] = ["# Untracked files content\r\n"]
+            for file, content in _read_untracked_files(repo_path, untracked_files):
+                if content is None:
+                    untracked_parts.append(f"\n\n--- {file} (untracked, binary) ---")
+                else:
+                    untracked_parts.append(f"\n\n--- {file} (untracked) ---\n{content}")
+            untracked_diff = "".join(untracked_parts)
 
             diff = tracked_diff + "\r\n\r\n" + untracked_diff
             return diff
@@ -214,11 +280,7 @@ class GitUtil:
         # 打开 Git 仓库
         repo = Repo(repo_path)
 
-        # 检查仓库状态，是否有未提交或未受版本控制的更改
-        if not repo.is_dirty(untracked_files=False):
-            return None
-
-        # 获取已版本控制文件的未提交差异
+        # 获取已版本控制文件的未提交差异，为空则没有更改
         tracked_diff = repo.git.diff()
         if BaseUtil.is_empty(tracked_diff):
             return None
@@ -240,31 +302,23 @@ class GitUtil:
         # 打开 Git 仓库
         repo = Repo(repo_path)
 
-        # 检查仓库状态，是否有未提交或未受版本控制的更改
-        if not repo.is_dirty(untracked_files=True):
-            return None
-
-        # 获取未受版本控制的文件列表
+        # 获取未受版本控制的文件列表，为空则没有未受版本控制的更改
         untracked_files = repo.untracked_files
+        if not untracked_files:
+            return None
 
         # 准备未受版本控制文件的差异内容
-        untracked_diff = ""
-        for file in untracked_files:
-            file_path = os.path.join(repo_path, file)
-            if not os.path.isfile(file_path):
-                continue
-
-            if FileUtil.is_binary_file(file_path):
-                untracked_diff += f"\r\n--- {file} (untracked, binary) ---"
+        untracked_parts: list[str] = []
+        for file, content in _read_untracked_files(repo_path, untracked_files):
+            if content is None:
+                untracked_parts.append(f"\r\n--- {file} (untracked, binary) ---")
             else:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                untracked_diff += f"\r\n--- {file} (untracked) ---\r\n{content}"
-        if BaseUtil.is_empty(untracked_diff):
+                untracked_parts.append(f"\r\n--- {file} (untracked) ---\r\n{content}")
+        if not untracked_parts:
             return None
         if with_header:
-            untracked_diff = "# Untracked File(s) Content\r\n" + untracked_diff
-        return untracked_diff
+            untracked_parts.insert(0, "# Untracked File(s) Content\r\n")
+        return "".join(untracked_parts)
 
     @staticmethod
     def add_files_to_stage(repo_path: str, exclude_dirs: list[str] = None, exclude_files: list[str] = None) -> bool:
@@ -282,7 +336,7 @@ class GitUtil:
             if not repo.is_dirty(untracked_files=True):
                 return False
 
-            exclusions = [f":(exclude){path}" for path in exclude_dirs + exclude_files]
+            exclusions = _build_exclusions(tuple(exclude_dirs), tuple(exclude_files))
 
             # 添加所有文件到暂存区，同时排除指定的目录和文件
             repo.git.add("--all", "--", *exclusions)
@@ -330,7 +384,7 @@ class GitUtil:
             #     return url.replace('git@', f'git@{self.username}:{self.password}@')
             raise RuntimeError(f'Unsupported repo protocol for authentication: {url}')
         else:
-            RuntimeError(f'Empty username or password for authentication, url: {url}')
+            raise RuntimeError(f'Empty username or password for authentication, url: {url}')
 
 
 if __name__ == "__main__":
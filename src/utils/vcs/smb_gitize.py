@@ -4,12 +4,16 @@
 Description: SMB Gitter Class Source Code.
 """
 
+import concurrent.futures
 import os.path
 
 from utils.fs.smb_utils import SmbConn
+from utils.log_ins import LogUtil
 from utils.vcs.git_repo import GitRepo
 from utils.vcs.git_util import GitUtil
 
+logger = LogUtil.get_logger()
+
 
 class SmbGitter:
     def __init__(self, smb_ip: str, smb_host_name: str, smb_username: str, smb_password: str,
@@ -28,8 +32,8 @@ class SmbGitter:
         self.git_repo = GitRepo(self.git_local_repo_path, self.git_remote_repo_path,
                                 self.git_repo_username, self.git_repo_password)
 
-    def run(self, commit_msg: str = "Auto commit"):
-        # Sync local repo from remote
+    def _sync_local_repo(self) -> None:
+        """Sync local repo from remote, clone it if the local repo does not exist."""
         if GitUtil.is_git_repository(self.git_local_repo_path):
             self.git_repo.discard_local_changes()
             self.git_repo.sync_from_remote()
@@ -37,9 +41,29 @@ class SmbGitter:
             os.makedirs(self.git_local_repo_path, exist_ok=True)
             self.git_repo.clone()
 
-        # Download recipe file(s) from remote SMB server
-        with SmbConn(ip=self.smb_ip, user=self.smb_username, password=self.smb_password,
-                     service_name=self.smb_service_name) as s:
+    def _create_smb_conn(self) -> SmbConn:
+        """Resolve the SMB host name, the connection itself is opened when entering the returned object."""
+        return SmbConn(ip=self.smb_ip, user=self.smb_username, password=self.smb_password,
+                       service_name=self.smb_service_name)
+
+    def run(self, commit_msg: str = "Auto commit"):
+        # Sync local repo from remote and resolve the SMB host concurrently, they share no resource
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            git_future = executor.submit(self._sync_local_repo)
+            smb_future = executor.submit(self._create_smb_conn)
+
+        # Both futures are done once the executor is shut down, report the SMB failure too if both failed
+        try:
+            git_future.result()
+        except Exception:
+            smb_error = smb_future.exception()
+            if smb_error is not None:
+                logger.error("Failed to prepare the SMB connection as well.", exc_info=smb_error)
+            raise
+
+        # Download recipe file(s) from remote SMB server once the local repo is synced, the session is only
+        # opened now so that it does not sit idle during a long clone
+        with smb_future.result() as s:
             s.download(self.smb_entry_path, self.git_local_repo_path)
 
         # Commit local changes and then push to remote
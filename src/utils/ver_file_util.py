@@ -4,6 +4,38 @@
 Description: String Utility Class Source Code.
 """
 
+import re
+from typing import Optional
+
+_VER_RE: re.Pattern = re.compile(r'\d+(?:\.\d+)*')
+_VERSION_TEMPLATE: str = """VSVersionInfo(
+    ffi=FixedFileInfo(
+        filevers=({}),
+        mask=0x3f,
+        flags=0x0,
+        OS=0x40004,
+        fileType=0x1,
+        subtype=0x0,
+        date=(0, 0)
+    ),
+    kids=[
+        StringFileInfo([
+            StringTable(u'040904B0', [
+                StringStruct(u'FileDescription', u'{}'),
+                StringStruct(u'FileVersion', u'{}'),
+                StringStruct(u'InternalName', u'{}'),
+                StringStruct(u'LegalCopyright', u'{}'),
+                StringStruct(u'OriginalFilename', u'{}'),
+                StringStruct(u'ProductName', u'{}'),
+                StringStruct(u'ProductVersion', u'{}'),
+                StringStruct(u'Language', u'{}'),
+                StringStruct(u'LegalTrademarks', u'{}')
+            ])
+        ]),
+        VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
+    ]
+)"""
+
 
 class VerFileData:
     def __init__(self, file_desc: str = '', file_ver: str = '', internal_name: str = '', legal_copyright: str = '',
@@ -20,50 +52,31 @@ class VerFileData:
         self.legal_trademarks: str = legal_trademarks
 
         self.comma_file_ver: str
+        self._rendered: Optional[str] = None
+        self._rendered_fields: Optional[tuple[str, ...]] = None
         self._parse_file_version()
 
     def _parse_file_version(self) -> None:
         if self.file_ver is None or self.file_ver == '':
             self.comma_file_ver = ''
             return
-        if not self.file_ver.replace('.', '').isdigit() or \
-                '..' in self.file_ver or \
-                self.file_ver.startswith('.') or \
-                self.file_ver.endswith('.'):
+        if not _VER_RE.fullmatch(self.file_ver):
             raise ValueError(f"Invalid file version: {self.file_ver}")
 
         self.comma_file_ver = self.file_ver.replace('.', ', ')
 
+    def _fields(self) -> tuple[str, ...]:
+        return (self.comma_file_ver, self.file_desc, self.file_ver, self.internal_name,
+                self.legal_copyright, self.original_name, self.product_name, self.product_version,
+                self.language, self.legal_trademarks)
+
     def __str__(self) -> str:
-        return "VSVersionInfo(\n\
-    ffi=FixedFileInfo(\n\
-        filevers=({}),\n\
-        mask=0x3f,\n\
-        flags=0x0,\n\
-        OS=0x40004,\n\
-        fileType=0x1,\n\
-        subtype=0x0,\n\
-        date=(0, 0)\n\
-    ),\n\
-    kids=[\n\
-        StringFileInfo([\n\
-            StringTable(u'040904B0', [\n\
-                StringStruct(u'FileDescription', u'{}'),\n\
-                StringStruct(u'FileVersion', u'{}'),\n\
-                StringStruct(u'InternalName', u'{}'),\n\
-                StringStruct(u'LegalCopyright', u'{}'),\n\
-                StringStruct(u'OriginalFilename', u'{}'),\n\
-                StringStruct(u'ProductName', u'{}'),\n\
-                StringStruct(u'ProductVersion', u'{}'),\n\
-                StringStruct(u'Language', u'{}'),\n\
-                StringStruct(u'LegalTrademarks', u'{}')\n\
-            ])\n\
-        ]),\n\
-        VarFileInfo([VarStruct(u'Translation', [1033, 1200])])\n\
-    ]\n\
-)".format(self.comma_file_ver, self.file_desc, self.file_ver, self.internal_name,
-          self.legal_copyright, self.original_name, self.product_name, self.product_version,
-          self.language, self.legal_trademarks)
+        # Render again only if any field has been changed since the last rendering
+        fields = self._fields()
+        if self._rendered is None or self._rendered_fields != fields:
+            self._rendered = _VERSION_TEMPLATE.format(*fields)
+            self._rendered_fields = fields
+        return self._rendered
 
 
 if __name__ == "__main__":
@@ -1,11 +1,72 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import ctypes
+import os
 import subprocess
-from typing import Optional, List, Dict
+import time
+from collections import namedtuple
+from typing import Dict, Optional, List, Tuple
 
 import win32cred
 import pywintypes
 
+try:
+    import win32wnet
+except ImportError:
+    win32wnet = None
+
+try:
+    from ctypes import wintypes
+
+    _CredWriteW = ctypes.WinDLL("advapi32", use_last_error=True).CredWriteW
+except (AttributeError, ImportError, OSError):
+    _CredWriteW = None
+
+if _CredWriteW is not None:
+    class _CREDENTIALW(ctypes.Structure):
+        """ Native CREDENTIALW layout from wincred.h """
+        _fields_ = [
+            ("Flags", wintypes.DWORD),
+            ("Type", wintypes.DWORD),
+            ("TargetName", wintypes.LPWSTR),
+            ("Comment", wintypes.LPWSTR),
+            ("LastWritten", wintypes.FILETIME),
+            ("CredentialBlobSize", wintypes.DWORD),
+            ("CredentialBlob", ctypes.POINTER(ctypes.c_ubyte)),
+            ("Persist", wintypes.DWORD),
+            ("AttributeCount", wintypes.DWORD),
+            ("Attributes", ctypes.c_void_p),
+            ("TargetAlias", wintypes.LPWSTR),
+            ("UserName", wintypes.LPWSTR),
+        ]
+
+    _CredWriteW.argtypes = (ctypes.POINTER(_CREDENTIALW), wintypes.DWORD)
+    _CredWriteW.restype = wintypes.BOOL
+
+class _KeyAccess:
+    """Keeps the dict-style access of the former dict results: cred["Password"], cred.get("UserName")."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+
+class CredMeta(_KeyAccess, namedtuple("CredMeta", "TargetName UserName Type Persist")):
+    """Credential metadata listed from the vault, lighter than a dict per entry."""
+    __slots__ = ()
+
+
+class CredentialRecord(_KeyAccess, namedtuple("CredentialRecord", "TargetName UserName Password Persist")):
+    """Credential read from the vault with its decoded password."""
+    __slots__ = ()
+
 
 class WindowsCredentialManager:
     """
@@ -17,34 +78,63 @@ class WindowsCredentialManager:
 
     CRED_TYPE = win32cred.CRED_TYPE_GENERIC
     CRED_PERSIST = win32cred.CRED_PERSIST_LOCAL_MACHINE
+    LIST_CACHE_TTL_SEC = 0.25
+    ERROR_NOT_FOUND = 1168
+    NET_USE_TIMEOUT_SEC = 5
+
+    # Bound once, saves the module attribute lookup on every read; staticmethod keeps them unbound
+    # whether pywin32 exposes builtins or plain Python functions
+    _CredRead = staticmethod(win32cred.CredRead)
+    _CredEnumerate = staticmethod(win32cred.CredEnumerate)
+
+    def __init__(self):
+        # (monotonic timestamp, credential list) of the last enumeration
+        self._cache: Optional[Tuple[float, List[CredMeta]]] = None
 
     # =========================
     # Public API
     # =========================
 
-    def list_credentials(self) -> List[Dict]:
+    def list_credentials(self) -> List[CredMeta]:
         """
         List all Windows credentials.
 
+        The enumeration is reused for LIST_CACHE_TTL_SEC seconds, and
+        dropped as soon as a credential is added, updated or deleted
+        through this instance.
+
         Returns:
-            List of credential metadata dictionaries.
+            List of credential metadata.
         """
+        if self._cache is not None and time.monotonic() - self._cache[0] < self.LIST_CACHE_TTL_SEC:
+            return list(self._cache[1])
+
         try:
-            credentials = win32cred.CredEnumerate(None, 0)
+            credentials = self._CredEnumerate(None, 0)
         except pywintypes.error:
             return []
 
-        result = []
-        for cred in credentials:
-            result.append({
-                "TargetName": cred.get("TargetName"),
-                "UserName": cred.get("UserName"),
-                "Type": cred.get("Type"),
-                "Persist": cred.get("Persist"),
-            })
-        return result
+        # All keys are always present in the credentials returned by pywin32
+        result = [CredMeta(c["TargetName"], c["UserName"], c["Type"], c["Persist"]) for c in credentials]
+        self._cache = (time.monotonic(), result)
+        return list(result)
+
+    def find_by_prefix(self, prefix: str) -> List[CredMeta]:
+        """
+        List the Windows credentials whose target starts with the prefix.
 
-    def get_credential(self, target: str) -> Optional[Dict]:
+        Args:
+            prefix: Target prefix (e.g. \\192.168.1.)
+
+        Returns:
+            List of credential metadata.
+        """
+        # Target names are case-insensitive in the vault, compare them folded
+        prefix = self._fold_target(prefix)
+        return [cred for cred in self.list_credentials()
+                if cred.TargetName and self._fold_target(cred.TargetName).startswith(prefix)]
+
+    def get_credential(self, target: str) -> Optional[CredentialRecord]:
         """
         Get a specific credential by target name.
 
@@ -52,19 +142,59 @@ class WindowsCredentialManager:
             target: Credential target (e.g. \\192.168.1.10)
 
         Returns:
-            Credential dictionary or None if not found.
+            Credential record or None if not found.
+
+        Raises:
+            pywintypes.error: Any failure other than ERROR_NOT_FOUND
         """
         try:
-            cred = win32cred.CredRead(target, self.CRED_TYPE, 0)
-        except pywintypes.error:
-            return None
+            cred = self._CredRead(target, self.CRED_TYPE, 0)
+        except pywintypes.error as e:
+            if e.winerror == self.ERROR_NOT_FOUND:
+                return None
+            raise
+
+        return self._to_record(cred)
+
+    def get_credentials(self, targets: List[str]) -> Dict[str, Optional[CredentialRecord]]:
+        """
+        Get several credentials by target name with a single enumeration.
 
-        return {
-            "TargetName": cred.get("TargetName"),
-            "UserName": cred.get("UserName"),
-            "Password": self._decode_password(cred.get("CredentialBlob")),
-            "Persist": cred.get("Persist"),
-        }
+        The vault is enumerated once, filtered by the longest prefix
+        common to all targets, instead of reading each target.
+
+        Args:
+            targets: Credential targets
+
+        Returns:
+            Mapping of each target to its credential record, or None if not found.
+
+        Raises:
+            pywintypes.error: Any failure other than ERROR_NOT_FOUND
+        """
+        result: Dict[str, Optional[CredentialRecord]] = dict.fromkeys(targets)
+        if not result:
+            return result
+
+        # Target names are case-insensitive in the vault, match them folded
+        folded_targets: Dict[str, List[str]] = {}
+        for target in result:
+            folded_targets.setdefault(self._fold_target(target), []).append(target)
+
+        prefix = os.path.commonprefix(list(folded_targets))
+        try:
+            credentials = self._CredEnumerate(prefix + "*" if prefix else None, 0)
+        except pywintypes.error as e:
+            if e.winerror == self.ERROR_NOT_FOUND:
+                return result
+            raise
+
+        for cred in credentials:
+            if cred["Type"] != self.CRED_TYPE:
+                continue
+            for target in folded_targets.get(self._fold_target(cred["TargetName"]), ()):
+                result[target] = self._to_record(cred)
+        return result
 
     def add_or_update_credential(
         self,
@@ -88,15 +218,13 @@ class WindowsCredentialManager:
         if reset_smb_session:
             self.reset_smb_access(target)
 
-        credential = {
-            "Type": self.CRED_TYPE,
-            "TargetName": target,
-            "UserName": username,
-            "CredentialBlob": password.encode("utf-16-le"),
-            "Persist": self.CRED_PERSIST,
-        }
-
-        win32cred.CredWrite(credential, 0)
+        # Mutable copy of the encoded password, wiped once written to the vault
+        blob = bytearray(password.encode("utf-16-le"))
+        try:
+            self._write_credential(target, username, blob)
+        finally:
+            self._scrub(blob)
+        self._cache = None
 
     def delete_credential(
         self,
@@ -118,6 +246,47 @@ class WindowsCredentialManager:
         except pywintypes.error:
             # Deleting a non-existing credential is safe (idempotent behavior)
             pass
+        finally:
+            self._cache = None
+
+    def bulk_upsert(
+        self,
+        entries: List[Tuple[str, str, str]],
+        reset_smb_session: bool = True,
+    ) -> None:
+        """
+        Add or update several Windows credentials.
+
+        The SMB sessions of each distinct target are reset only once,
+        however many entries share the target.
+
+        Args:
+            entries: (target, username, password) tuples
+            reset_smb_session: Whether to drop existing SMB sessions first
+        """
+        if reset_smb_session:
+            self._reset_smb_access_of_targets(target for target, _, _ in entries)
+
+        for target, username, password in entries:
+            self.add_or_update_credential(target, username, password, reset_smb_session=False)
+
+    def bulk_delete(
+        self,
+        targets: List[str],
+        reset_smb_session: bool = True,
+    ) -> None:
+        """
+        Delete several Windows credentials.
+
+        Args:
+            targets: Credential targets
+            reset_smb_session: Whether to drop existing SMB sessions first
+        """
+        if reset_smb_session:
+            self._reset_smb_access_of_targets(targets)
+
+        for target in targets:
+            self.delete_credential(target, reset_smb_session=False)
 
     def reset_smb_access(self, target: str) -> None:
         """
@@ -134,6 +303,103 @@ class WindowsCredentialManager:
     # Internal helpers
     # =========================
 
+    def _reset_smb_access_of_targets(self, targets) -> None:
+        """
+        Reset SMB access once per distinct target, keeping the first-seen order.
+
+        Args:
+            targets: Iterable of SMB server targets, duplicates allowed
+        """
+        for target in dict.fromkeys(targets):
+            self.reset_smb_access(target)
+
+    @classmethod
+    def _write_credential(cls, target: str, username: str, blob: bytearray) -> None:
+        """
+        Write a credential to the vault.
+
+        advapi32!CredWriteW is called directly through ctypes when available,
+        which releases the GIL during the call and skips building the pywin32
+        credential dict; win32cred.CredWrite is used otherwise.
+
+        Args:
+            target: Credential target
+            username: Username
+            blob: UTF-16-LE encoded password, not copied
+
+        Raises:
+            pywintypes.error: If the credential cannot be written
+        """
+        if _CredWriteW is None:
+            win32cred.CredWrite({
+                "Type": cls.CRED_TYPE,
+                "TargetName": target,
+                "UserName": username,
+                "CredentialBlob": blob,
+                "Persist": cls.CRED_PERSIST,
+            }, 0)
+            return
+
+        credential = _CREDENTIALW(
+            Type=cls.CRED_TYPE,
+            TargetName=target,
+            UserName=username,
+            CredentialBlobSize=len(blob),
+            CredentialBlob=(ctypes.c_ubyte * len(blob)).from_buffer(blob) if blob else None,
+            Persist=cls.CRED_PERSIST,
+        )
+        if not _CredWriteW(ctypes.byref(credential), 0):
+            error = ctypes.get_last_error()
+            raise pywintypes.error(error, "CredWrite", ctypes.FormatError(error))
+
+    @staticmethod
+    def _fold_target(target: str) -> str:
+        """
+        Fold a target name for an ordinal case-insensitive comparison, as the vault compares target names.
+
+        Each character is upper-cased on its own and kept as is if that would change its length
+        (e.g. 'ß' -> 'SS'), so a folded prefix still lines up with the raw target names.
+
+        Args:
+            target: Credential target
+
+        Returns:
+            Folded target of the same length.
+        """
+        folded = target.upper()
+        if len(folded) == len(target):
+            return folded
+        return "".join(upper if len(upper := char.upper()) == 1 else char for char in target)
+
+    @classmethod
+    def _to_record(cls, cred: dict) -> CredentialRecord:
+        """
+        Build a credential record from a credential returned by pywin32.
+
+        Args:
+            cred: Credential dict from CredRead or CredEnumerate
+
+        Returns:
+            Credential record with the decoded password.
+        """
+        return CredentialRecord(
+            cred["TargetName"],
+            cred["UserName"],
+            cls._decode_password(cred["CredentialBlob"]),
+            cred["Persist"],
+        )
+
+    @staticmethod
+    def _scrub(buffer: bytearray) -> None:
+        """
+        Overwrite a buffer holding a plaintext secret with zeros in place.
+
+        Args:
+            buffer: Buffer to wipe
+        """
+        if buffer:
+            ctypes.memset((ctypes.c_char * len(buffer)).from_buffer(buffer), 0, len(buffer))
+
     @staticmethod
     def _decode_password(blob: Optional[bytes]) -> Optional[str]:
         """
@@ -152,22 +418,49 @@ class WindowsCredentialManager:
     @staticmethod
     def _net_use_delete(target: str) -> None:
         """
-        Execute 'net use <target> /delete /y' to clear SMB sessions.
+        Clear SMB sessions of the target, same as 'net use <target> /delete /y'.
+
+        The connection is cancelled in-process by WNetCancelConnection2, 'net use'
+        is only spawned if win32wnet is unavailable.
 
         This function is intentionally tolerant to failures to keep
         higher-level logic stable.
 
+        Args:
+            target: SMB server target
+        """
+        if win32wnet is None:
+            WindowsCredentialManager._run_net_use_delete(target)
+            return
+
+        try:
+            # Force cancellation even if files are open, like '/y'
+            win32wnet.WNetCancelConnection2(target, 0, True)
+        except pywintypes.error:
+            # ERROR_NOT_CONNECTED means there is nothing to cancel, never propagate SMB cleanup errors
+            pass
+
+    @staticmethod
+    def _run_net_use_delete(target: str) -> None:
+        """
+        Execute 'net use <target> /delete /y' to clear SMB sessions.
+
+        net.exe is spawned directly without cmd.exe and without a console
+        window, and is given up on after NET_USE_TIMEOUT_SEC seconds.
+
         Args:
             target: SMB server target
         """
         try:
             subprocess.run(
                 ["net", "use", target, "/delete", "/y"],
-                shell=True,
+                shell=False,
+                creationflags=subprocess.CREATE_NO_WINDOW,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 check=False,
+                timeout=WindowsCredentialManager.NET_USE_TIMEOUT_SEC,
             )
-        except Exception:
-            # Never propagate SMB cleanup errors
+        except (OSError, subprocess.SubprocessError):
+            # Never propagate SMB cleanup errors (net.exe missing, or hung and killed on timeout)
             pass
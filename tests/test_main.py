@@ -4,19 +4,34 @@
 Description: Test Cases Entry.
 """
 
+import importlib.util
 import os
+import sys
 import unittest
 
-if __name__ == '__main__':
-    # 创建测试套件
-    loader = unittest.TestLoader()
+try:
+    import pytest
+except ImportError:
+    pytest = None
 
+# pytest-xdist is only needed as a plugin, so probe for it instead of importing it
+if importlib.util.find_spec("xdist") is None:
+    pytest = None
+
+if __name__ == '__main__':
     # 当前目录是 tests 目录
     current_dir = os.path.dirname(__file__)
 
+    # 安装了 pytest-xdist 时按 CPU 核数并行运行，loadfile 保证同一测试文件在同一进程中执行（setUpClass 只运行一次）
+    if pytest is not None:
+        sys.exit(pytest.main(["-n", "auto", "--dist=loadfile", current_dir]))
+
+    # 创建测试套件
+    loader = unittest.TestLoader()
+
     # 递归发现 tests 目录下的所有测试模块
-    suite = loader.discover(start_dir=current_dir, pattern='*.py', top_level_dir=current_dir)
+    suite = loader.discover(start_dir=current_dir, pattern='test_*.py', top_level_dir=current_dir)
 
     # 运行测试
     runner = unittest.TextTestRunner()
-    runner.run(suite)
+    sys.exit(not runner.run(suite).wasSuccessful())
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Base Class of Test Cases Using a Temporary Data Directory.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TempDirTestBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One scratch root for the whole class outside the project tree, parallel test workers never share one
+        cls.tmpdir = tempfile.mkdtemp(prefix=f"{cls.__name__}_")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    def setUp(self):
+        # Every test works inside its own sub-directory
+        self.case_dir = os.path.join(self.tmpdir, self._testMethodName)
+        os.makedirs(self.case_dir)
@@ -5,26 +5,17 @@ Description: Compress Utility Class Test Cases.
 """
 
 import os
-import unittest
 
 from utils.fs.compress_util import CompressUtil
-from utils.fs.fs_util import FsUtil
 from utils.codec.hash_util import HashUtil
 
+from ..base_test_case import TempDirTestBase
 
-class TestCompressUtil(unittest.TestCase):
-    def setUp(self):
-        self.test_root_dir = os.path.join(FsUtil.get_current_project_root_path(), "tests")
-        self.test_data_root_dir = os.path.join(self.test_root_dir, "test_data")
-        self.test_class_data_root_dir = os.path.join(self.test_data_root_dir, "test_utils", "test_compress_util")
-        FsUtil.remake_dirs(self.test_class_data_root_dir)
-
-    def tearDown(self):
-        FsUtil.force_remove(self.test_class_data_root_dir, not_exist_ok=True)
 
+class TestCompressUtil(TempDirTestBase):
     def test_compress_then_decompress(self):
         # Prepare test data
-        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_compress_then_decompress")
+        test_data_dir = self.case_dir
         to_be_compress_dir = os.path.join(test_data_dir, "to_be_compress")
         os.makedirs(to_be_compress_dir, exist_ok=True)
         with open(os.path.join(to_be_compress_dir, "1.txt"), "w", encoding="utf-8") as f:
@@ -50,3 +41,43 @@ class TestCompressUtil(unittest.TestCase):
         compress_dir_hash = HashUtil.calculate_directory_hash(to_be_compress_dir)
         decompressed_dir_hash = HashUtil.calculate_directory_hash(decompressed_dir)
         self.assertEqual(compress_dir_hash, decompressed_dir_hash)
+
+    def test_compress_then_decompress_with_hashes(self):
+        # Prepare test data
+        to_be_compress_dir = os.path.join(self.case_dir, "to_be_compress")
+        os.makedirs(os.path.join(to_be_compress_dir, "sub"))
+        with open(os.path.join(to_be_compress_dir, "1.txt"), "w", encoding="utf-8") as f:
+            f.write("Hello world Txt!")
+        with open(os.path.join(to_be_compress_dir, "sub", "2.log"), "w", encoding="utf-8") as f:
+            f.write("Hello world Log!")
+
+        # Compress the data, the file hashes are computed while streaming into the archive
+        compressed_file = to_be_compress_dir + ".zip"
+        compress_hashes = CompressUtil.compress_with_hashes(to_be_compress_dir, compressed_file, level=9)
+        self.assertEqual(sorted(compress_hashes), ["1.txt", "sub/2.log"])
+
+        # Check the compressed data before decompressing it
+        CompressUtil.check_zip_file(compressed_file)
+
+        # Decompress the compressed data, the hashes are computed while writing the members
+        decompressed_dir = os.path.join(self.case_dir, "decompressed")
+        decompress_hashes = CompressUtil.decompress_with_hashes(compressed_file, decompressed_dir)
+        self.assertEqual(compress_hashes, decompress_hashes)
+        with open(os.path.join(decompressed_dir, "sub", "2.log"), "r", encoding="utf-8") as f:
+            self.assertEqual("Hello world Log!", f.read())
+
+    def test_compress_with_hashes_level(self):
+        # Compressible but not trivial data, the archive size must follow the requested level
+        to_be_compress_file = os.path.join(self.case_dir, "data.txt")
+        with open(to_be_compress_file, "w", encoding="utf-8") as f:
+            f.write("".join(f"line {i} {i * i % 97}\n" for i in range(50000)))
+
+        sizes = {}
+        hashes = {}
+        for level in (0, 1, 9):
+            compressed_file = os.path.join(self.case_dir, f"level_{level}.zip")
+            hashes[level] = CompressUtil.compress_with_hashes(to_be_compress_file, compressed_file, level=level)
+            sizes[level] = os.path.getsize(compressed_file)
+        self.assertGreater(sizes[0], sizes[1])
+        self.assertGreater(sizes[1], sizes[9])
+        self.assertEqual(hashes[0], hashes[9])
@@ -5,22 +5,18 @@ Description: File System Utility Class Test Cases.
 """
 
 import os
+import sys
 import time
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from utils.fs.fs_util import FsUtil
 
+from ..base_test_case import TempDirTestBase
 
-class TestFsUtil(unittest.TestCase):
-    def setUp(self):
-        self.test_root_dir = os.path.join(FsUtil.get_current_project_root_path(), "tests")
-        self.test_data_root_dir = os.path.join(self.test_root_dir, "test_data")
-        self.test_class_data_root_dir = os.path.join(self.test_data_root_dir, "test_utils", "test_fs_utils")
-
-    def tearDown(self):
-        FsUtil.force_remove(self.test_class_data_root_dir, not_exist_ok=True)
 
+class TestFsUtil(TempDirTestBase):
     @patch.object(FsUtil, 'get_project_root_path', return_value='mocker')
     def test_get_project_root_path(self, mocker):
         self.assertEqual(FsUtil.get_project_root_path(), 'mocker')
@@ -29,14 +25,11 @@ class TestFsUtil(unittest.TestCase):
         mocker.assert_called_once()
 
     def test_get_current_project_root_path(self):
-        current_project_root_path: str = os.path.abspath(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        )
+        current_project_root_path: str = str(Path(__file__).resolve().parents[3])
         self.assertEqual(current_project_root_path, FsUtil.get_current_project_root_path())
 
     def test_is_empty_dir(self):
-        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_is_empty_dir")
-        FsUtil.remake_dirs(test_data_dir)
+        test_data_dir = self.case_dir
 
         # Pass empty directory
         self.assertTrue(FsUtil.is_empty_dir(test_data_dir))
@@ -54,7 +47,7 @@ class TestFsUtil(unittest.TestCase):
         self.assertFalse(FsUtil.is_empty_dir(os.path.join(test_data_dir, "non_exist")))
 
     def test_remake_dirs(self):
-        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_remake_dirs")
+        test_data_dir = os.path.join(self.case_dir, "test_remake_dirs")
         FsUtil.remake_dirs(test_data_dir)
         self.assertTrue(FsUtil.is_empty_dir(test_data_dir))
 
@@ -71,14 +64,15 @@ class TestFsUtil(unittest.TestCase):
 
         FsUtil.force_remove(test_data_dir)
 
-    def test_move_path_file(self):
-        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_move_path")
-        FsUtil.remake_dirs(test_data_dir)
+    def _make_move_path_dirs(self) -> tuple[str, str]:
+        dir1 = os.path.join(self.case_dir, "dir1")
+        os.makedirs(dir1)
+        dir2 = os.path.join(self.case_dir, "dir2")
+        os.makedirs(dir2)
+        return dir1, dir2
 
-        dir1 = os.path.join(test_data_dir, "dir1")
-        FsUtil.remake_dirs(dir1)
-        dir2 = os.path.join(test_data_dir, "dir2")
-        FsUtil.remake_dirs(dir2)
+    def test_move_path_file(self):
+        dir1, dir2 = self._make_move_path_dirs()
         file_path = os.path.join(dir1, "test.txt")
         with open(file_path, 'w') as f:
             f.write("Hello world!")
@@ -91,13 +85,7 @@ class TestFsUtil(unittest.TestCase):
             self.assertEqual("Hello world!", file.read())
 
     def test_move_path_dir_with_content(self):
-        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_move_path")
-        FsUtil.remake_dirs(test_data_dir)
-
-        dir1 = os.path.join(test_data_dir, "dir1")
-        FsUtil.remake_dirs(dir1)
-        dir2 = os.path.join(test_data_dir, "dir2")
-        FsUtil.remake_dirs(dir2)
+        dir1, dir2 = self._make_move_path_dirs()
 
         content_dir = os.path.join(dir1, "content_dir")
         FsUtil.remake_dirs(content_dir)
@@ -113,13 +101,7 @@ class TestFsUtil(unittest.TestCase):
             self.assertEqual("Hello world!", file.read())
 
     def test_move_path_dir_without_content(self):
-        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_move_path")
-        FsUtil.remake_dirs(test_data_dir)
-
-        dir1 = os.path.join(test_data_dir, "dir1")
-        FsUtil.remake_dirs(dir1)
-        dir2 = os.path.join(test_data_dir, "dir2")
-        FsUtil.remake_dirs(dir2)
+        dir1, dir2 = self._make_move_path_dirs()
 
         content_dir = os.path.join(dir1, "content_dir")
         FsUtil.remake_dirs(content_dir)
@@ -133,10 +115,9 @@ class TestFsUtil(unittest.TestCase):
         self.assertEqual(FsUtil.get_file_extension("D:\\path\\file.extension"), ".extension")
         self.assertEqual(FsUtil.get_file_extension("D:\\path\\file.ext1.ext2"), ".ext2")
 
+    @unittest.skipUnless(sys.platform == "win32", "Windows only")
     def test_set_file_times(self):
-        test_data_dir: str = os.path.join(self.test_class_data_root_dir, "test_set_file_times")
-        FsUtil.remake_dirs(test_data_dir)
-        file_path: str = os.path.join(test_data_dir, "file_times.txt")
+        file_path: str = os.path.join(self.case_dir, "file_times.txt")
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write('')
         timestamp: float = time.time()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Hash Utility Class Test Cases.
+"""
+
+import hashlib
+import os
+import unittest
+
+from utils.codec.hash_util import HashUtil
+
+from .base_test_case import TempDirTestBase
+
+
+class TestHashUtil(TempDirTestBase):
+    def test_calculate_file_hash(self):
+        # Small file (buffered) and large file (memory mapped)
+        for size in (16, 2 * 1024 * 1024):
+            content = os.urandom(size)
+            file_path = os.path.join(self.case_dir, f"{size}.bin")
+            with open(file_path, "wb") as f:
+                f.write(content)
+            self.assertEqual(hashlib.md5(content).hexdigest(), HashUtil.calculate_file_hash(file_path))
+            self.assertEqual(hashlib.sha256(content).digest(),
+                             HashUtil.calculate_file_hash_digest(file_path, "sha256"))
+
+    def test_calculate_directory_hash(self):
+        dir1 = os.path.join(self.case_dir, "dir1")
+        dir2 = os.path.join(self.case_dir, "dir2")
+        for dir_path in (dir1, dir2):
+            os.makedirs(os.path.join(dir_path, "sub"))
+            with open(os.path.join(dir_path, "a.txt"), "w", encoding="utf-8") as f:
+                f.write("Hello")
+            with open(os.path.join(dir_path, "sub", "b.txt"), "w", encoding="utf-8") as f:
+                f.write("world")
+        self.assertEqual(HashUtil.calculate_directory_hash(dir1), HashUtil.calculate_directory_hash(dir2))
+
+        with open(os.path.join(dir2, "sub", "b.txt"), "w", encoding="utf-8") as f:
+            f.write("World")
+        self.assertNotEqual(HashUtil.calculate_directory_hash(dir1), HashUtil.calculate_directory_hash(dir2))
+
+        with self.assertRaises(ValueError):
+            HashUtil.calculate_directory_hash(os.path.join(self.case_dir, "not_exist"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,16 +10,22 @@ from utils.log_ins import LogUtil
 
 
 class TestLogUtils(unittest.TestCase):
-    def setUp(self):
-        pass
-
-    def tearDown(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls.logger = LogUtil.get_logger()
 
     def test_get_logger(self):
-        logger1 = LogUtil.get_logger()
-        logger2 = LogUtil.get_logger()
-        self.assertEqual(logger1, logger2)
+        self.assertIs(self.logger, LogUtil.get_logger())
+
+    def test_reset_for_tests(self):
+        LogUtil._reset_for_tests()
+        self.assertIsNone(LogUtil.get_log_file_path())
+
+        # The logger is initialized again, without duplicated handlers
+        logger = LogUtil.get_logger()
+        self.assertIsNotNone(LogUtil.get_log_file_path())
+        self.assertEqual(2, len(logger.handlers))
+        self.assertIs(logger, LogUtil.get_logger())
 
 
 if __name__ == '__main__':
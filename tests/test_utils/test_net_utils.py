@@ -5,6 +5,7 @@ Description: File System Utility Class Test Cases.
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from utils.net_util import NetUtil
 
@@ -17,9 +18,14 @@ class TestNetUtil(unittest.TestCase):
         pass
 
     def test_is_server_pingable(self):
-        self.assertTrue(NetUtil.is_server_pingable(dest_addr="www.baidu.com", timeout=10))
-        self.assertTrue(NetUtil.is_server_pingable(dest_addr="1.1.1.1", timeout=4))
-        self.assertFalse(NetUtil.is_server_pingable(dest_addr="63.254.254.254", timeout=3))
+        # The pings are independent, run them concurrently so the wall time is bounded by the longest timeout
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            fut_domain = executor.submit(NetUtil.is_server_pingable, dest_addr="www.baidu.com", timeout=10)
+            fut_ip = executor.submit(NetUtil.is_server_pingable, dest_addr="1.1.1.1", timeout=4)
+            fut_unreachable = executor.submit(NetUtil.is_server_pingable, dest_addr="63.254.254.254", timeout=3)
+            self.assertTrue(fut_domain.result())
+            self.assertTrue(fut_ip.result())
+            self.assertFalse(fut_unreachable.result())
 
 
 if __name__ == '__main__':
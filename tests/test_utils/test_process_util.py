@@ -4,18 +4,24 @@
 Description: Process Utility Class Test Cases.
 """
 
+import sys
 import unittest
 import psutil
 
-from utils.process_util import ProcessUtil
+try:
+    from utils.process_util import ProcessUtil
+except ImportError:  # Windows only module
+    ProcessUtil = None
 
 
+@unittest.skipUnless(sys.platform == "win32", "Windows only")
 class TestProcessUtil(unittest.TestCase):
     def setUp(self):
-        pass
+        # The priority is process-global, restore it so later tests in the same worker are not slowed down
+        self._saved_priority = ProcessUtil.get_current_process_priority()
 
     def tearDown(self):
-        pass
+        ProcessUtil.set_current_process_priority(self._saved_priority)
 
     def test_set_current_process_lowest_priority(self) -> None:
         self.assertEqual(psutil.NORMAL_PRIORITY_CLASS, ProcessUtil.get_current_process_priority())
@@ -9,6 +9,20 @@ import unittest
 from utils.str_util import StrUtil
 
 
+# (字串, 进制, 期望结果)
+IS_VALID_BASE_NUMBER_CASES = (
+    (" 10 ", 16, False),  # 带非数字字符
+    ("", 16, False),  # 空字串
+    ("1010", 2, True),  # 二进制
+    ("0b1010", 2, True),  # 带0b前缀的二进制
+    ("755", 8, True),  # 八进制
+    ("0o755", 8, True),  # 带0o前缀的八进制
+    ("123", 10, True),  # 十进制
+    ("1A3F", 16, True),  # 十六进制
+    ("0x1A3F", 16, True),  # 带0x前缀的十六进制
+)
+
+
 class TestStrUtil(unittest.TestCase):
     def setUp(self):
         pass
@@ -17,16 +31,10 @@ class TestStrUtil(unittest.TestCase):
         pass
 
     def test_is_valid_base_number(self):
-        self.assertFalse(StrUtil.is_valid_base_number(" 10 ", 16))  # False, 带非数字字符
-        self.assertFalse(StrUtil.is_valid_base_number("", 16))  # False, 空字串
-
-        self.assertTrue(StrUtil.is_valid_base_number("1010", 2))  # True, 二进制
-        self.assertTrue(StrUtil.is_valid_base_number("0b1010", 2))  # True, 带0b前缀的二进制
-        self.assertTrue(StrUtil.is_valid_base_number("755", 8))  # True, 八进制
-        self.assertTrue(StrUtil.is_valid_base_number("0o755", 8))  # True, 带0o前缀的八进制
-        self.assertTrue(StrUtil.is_valid_base_number("123", 10))  # True, 十进制
-        self.assertTrue(StrUtil.is_valid_base_number("1A3F", 16))  # True, 十六进制
-        self.assertTrue(StrUtil.is_valid_base_number("0x1A3F", 16))  # True, 带0x前缀的十六进制
+        # 每个用例独立报告，一个失败不会掩盖其余用例
+        for s, base, expected in IS_VALID_BASE_NUMBER_CASES:
+            with self.subTest(s=s, base=base):
+                self.assertIs(StrUtil.is_valid_base_number(s, base), expected)
 
 
 if __name__ == '__main__':
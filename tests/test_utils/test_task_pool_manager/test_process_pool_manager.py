@@ -4,21 +4,52 @@
 Description: Process Pool Manager Class Test Cases.
 """
 
+import threading
 import unittest
-from utils.task_pool_manager.process_pool_manager import ProcessPoolManager, text_handler, math_handler
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+
+from utils.task_pool_manager.process_pool_manager import (ProcessPoolManager, SharedMemoryRing,
+                                                          text_handler, math_handler)
+
+
+# Requests shared by the tests, the managers assign an id to the message, so copies are sent
+REQUESTS = (
+    {"type": "text", "data": "hello"},
+    {"type": "math", "data": {"x": 2, "y": 3}},
+    {"type": "text", "data": "world"},
+)
+EXPECTED = (
+    {"result": "HELLO"},
+    {"result": 5},
+    {"result": "WORLD"},
+)
+
+
+def create_started_manager() -> ProcessPoolManager:
+    """Create a ProcessPoolManager with the example handlers and its workers started."""
+    manager = ProcessPoolManager(num_workers=2)
+    manager.register_handler("text", text_handler)
+    manager.register_handler("math", math_handler)
+    manager.start_workers()
+    return manager
 
 
 class TestProcessPoolManager(unittest.TestCase):
-    def setUp(self):
-        """Set up the ProcessPoolManager for testing."""
-        self.manager = ProcessPoolManager(num_workers=2)
-        self.manager.register_handler("text", text_handler)
-        self.manager.register_handler("math", math_handler)
-        self.manager.start_workers()
+    @classmethod
+    def setUpClass(cls):
+        """Start the worker processes once, spawning them dominates the cost of the tests."""
+        cls.manager = create_started_manager()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up by stopping all worker processes."""
-        self.manager.stop_workers()
+        cls.manager.stop_workers()
+
+    def setUp(self):
+        """Drain any response left over by a previous test."""
+        while self.manager.get_response(timeout=0) is not None:
+            pass
 
     def test_register_handler(self):
         """Test that handlers can be correctly registered."""
@@ -26,6 +57,7 @@ class TestProcessPoolManager(unittest.TestCase):
             return data
 
         self.manager.register_handler("dummy", dummy_handler)
+        self.addCleanup(self.manager.handlers.pop, "dummy")
         self.assertIn("dummy", self.manager.handlers)
         self.assertEqual(self.manager.handlers["dummy"], dummy_handler)
 
@@ -43,6 +75,14 @@ class TestProcessPoolManager(unittest.TestCase):
         self.assertIsNotNone(response)
         self.assertEqual(response["result"], 15)
 
+    def test_many_requests_in_flight(self):
+        """Test that the default unbounded transport accepts many requests before any is drained."""
+        count = 2500
+        for i in range(count):
+            self.manager.send_request({"type": "math", "data": {"x": i, "y": 1}})
+        results = self.manager.get_responses(count, timeout=30)
+        self.assertEqual(sorted(result["result"] for result in results), list(range(1, count + 1)))
+
     def test_unknown_message_type(self):
         """Test sending an unknown message type."""
         with self.assertRaises(ValueError) as context:
@@ -51,34 +91,32 @@ class TestProcessPoolManager(unittest.TestCase):
 
     def test_multiple_requests(self):
         """Test handling multiple requests concurrently."""
-        requests = [
-            {"type": "text", "data": "hello"},
-            {"type": "math", "data": {"x": 2, "y": 3}},
-            {"type": "text", "data": "world"},
-        ]
-        for request in requests:
-            self.manager.send_request(request)
-
-        results = []
-        for _ in range(len(requests)):
-            response = self.manager.get_response(timeout=5)
-            results.append(response)
+        for request in REQUESTS:
+            self.manager.send_request(dict(request))
+
+        # Workers may finish out of order, compare the responses in task id order
+        results = sorted(self.manager.get_responses(len(REQUESTS), timeout=5), key=lambda response: response["id"])
 
         # Verify results
-        self.assertEqual(len(results), 3)
-        expected_results = [
-            {"result": "HELLO"},
-            {"result": 5},
-            {"result": "WORLD"},
-        ]
-        for result, expected in zip(results, expected_results):
+        self.assertEqual(len(results), len(EXPECTED))
+        for result, expected in zip(results, EXPECTED):
             self.assertEqual(result["result"], expected["result"])
 
+    def test_single_request(self):
+        """Test each request on its own, every case is reported independently."""
+        for request, expected in zip(REQUESTS, EXPECTED):
+            with self.subTest(request=request):
+                self.manager.send_request(dict(request))
+                response = self.manager.get_response(timeout=5)
+                self.assertIsNotNone(response)
+                self.assertEqual(response["result"], expected["result"])
+
     def test_stop_workers(self):
-        """Test stopping all worker processes."""
-        self.manager.stop_workers()
+        """Test stopping all worker processes, on a dedicated manager to keep the shared one running."""
+        manager = create_started_manager()
+        manager.stop_workers()
         with self.assertRaises(RuntimeError) as context:
-            self.manager.send_request({"type": "text", "data": "test"})
+            manager.send_request({"type": "text", "data": "test"})
         self.assertIn("worker processes are not running", str(context.exception))
 
     def test_empty_response(self):
@@ -87,5 +125,96 @@ class TestProcessPoolManager(unittest.TestCase):
         self.assertIsNone(response)
 
 
+class TestSharedMemoryRing(unittest.TestCase):
+    def setUp(self):
+        self.ring = SharedMemoryRing(capacity=2, slot_size=64)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def test_put_get_wraps_around(self):
+        """Test that messages keep FIFO order across the ring boundary."""
+        for i in range(5):
+            self.ring.put({"id": i})
+            self.assertEqual(self.ring.get(timeout=1), {"id": i})
+
+    def test_get_many(self):
+        """Test that a batch get returns what is available once the timeout expires."""
+        self.ring.put(1)
+        self.ring.put(2)
+        self.assertEqual(self.ring.get_many(2, timeout=1), [1, 2])
+        self.ring.put(3)
+        self.assertEqual(self.ring.get_many(2, timeout=0.01), [3])
+
+    def test_get_timeout(self):
+        """Test that getting from an empty ring raises queue.Empty."""
+        with self.assertRaises(Empty):
+            self.ring.get(timeout=0.01)
+
+    def test_oversized_message(self):
+        """Test that a message larger than a slot goes through the overflow path in order."""
+        self.ring.put("x" * 64)
+        self.ring.put("small")
+        self.assertEqual(self.ring.get(timeout=1), "x" * 64)
+        self.assertEqual(self.ring.get_many(1, timeout=1), ["small"])
+
+    def test_put_full(self):
+        """Test that putting into a full ring raises queue.Full instead of blocking forever."""
+        self.ring.put(1)
+        self.ring.put("x" * 64)
+        with self.assertRaises(Full):
+            self.ring.put(3, timeout=0.01)
+        with self.assertRaises(Full):
+            self.ring.put(3, block=False)
+        self.assertEqual(self.ring.get(timeout=1), 1)
+        self.ring.put(3, block=False)
+
+
+class TestProcessPoolManagerWithRing(unittest.TestCase):
+    def setUp(self):
+        self.manager = ProcessPoolManager(num_workers=2, ring_capacity=4, ring_slot_size=256)
+        self.manager.register_handler("text", text_handler)
+        self.manager.start_workers()
+
+    def tearDown(self):
+        self.manager.stop_workers()
+
+    def test_oversized_request_and_response(self):
+        """Test that payloads larger than a slot are processed like the others."""
+        self.manager.send_request({"type": "text", "data": "a" * 5000})
+        response = self.manager.get_response(timeout=5)
+        self.assertIsNotNone(response)
+        self.assertEqual(response["result"], "A" * 5000)
+
+    def test_send_request_timeout(self):
+        """Test that a full request ring raises queue.Full after the timeout."""
+        with self.assertRaises(Full):
+            for _ in range(100):
+                self.manager.send_request({"type": "text", "data": "x"}, timeout=0.05)
+
+    def test_stop_workers_with_undrained_responses(self):
+        """Test that stopping does not hang when both rings are full, and that the rings are released."""
+        with self.assertRaises(Full):
+            for _ in range(100):
+                self.manager.send_request({"type": "text", "data": "x"}, timeout=0.05)
+        shm_names = [self.manager.request_queue._shm.name, self.manager.response_queue._shm.name]
+
+        # Nobody drained the responses, the workers are blocked on the full response ring
+        stopper = threading.Thread(target=self.manager.stop_workers, daemon=True)
+        stopper.start()
+        stopper.join(timeout=30)
+        self.assertFalse(stopper.is_alive(), "stop_workers hangs on full rings")
+        for name in shm_names:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=name)
+
+    def test_restart_after_stop(self):
+        """Test that the rings released by stop_workers are created again when the workers restart."""
+        self.manager.stop_workers()
+        self.manager.start_workers()
+        self.manager.send_request({"type": "text", "data": "again"})
+        self.assertEqual(self.manager.get_response(timeout=5)["result"], "AGAIN")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Queue Utility Class Test Cases.
+"""
+
+import unittest
+from queue import Queue
+
+from utils.task_pool_manager.process_pool_manager import SharedMemoryRing
+from utils.task_pool_manager.queue_util import QueueUtil
+
+
+class TestQueueUtil(unittest.TestCase):
+    def test_get_many_queue(self):
+        """Test that a plain queue is drained up to n items, and returns what is there once the timeout expires."""
+        queue = Queue()
+        for i in range(5):
+            queue.put(i)
+        self.assertEqual(QueueUtil.get_many(queue, 3, timeout=1), [0, 1, 2])
+        self.assertEqual(QueueUtil.get_many(queue, 3, timeout=0.01), [3, 4])
+        self.assertEqual(QueueUtil.get_many(queue, 3, timeout=0), [])
+
+    def test_get_many_ring(self):
+        """Test that a queue with its own batched get_many is read through it."""
+        ring = SharedMemoryRing(capacity=4, slot_size=64)
+        self.addCleanup(ring.close)
+        for i in range(3):
+            ring.put(i)
+        self.assertEqual(QueueUtil.get_many(ring, 2, timeout=1), [0, 1])
+        self.assertEqual(QueueUtil.get_many(ring, 2, timeout=0.01), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
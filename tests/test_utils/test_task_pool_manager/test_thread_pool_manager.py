@@ -19,16 +19,40 @@ def math_handler(data: Dict[str, Any]) -> int:
     return data["x"] + data["y"]
 
 
+# Requests shared by the tests, the managers assign an id to the message, so copies are sent
+REQUESTS = (
+    {"type": "text", "data": "hello"},
+    {"type": "math", "data": {"x": 2, "y": 3}},
+    {"type": "text", "data": "world"},
+)
+EXPECTED = (
+    {"result": "HELLO"},
+    {"result": 5},
+    {"result": "WORLD"},
+)
+
+
 class TestThreadPoolManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Set up one ThreadPoolManager shared by all the tests."""
+        cls.manager = ThreadPoolManager(max_workers=2)
+        cls.manager.register_handler("text", text_handler)
+        cls.manager.register_handler("math", math_handler)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the thread pool after all the tests."""
+        cls.manager.shutdown()
+
     def setUp(self):
-        """Set up the ThreadPoolManager for testing."""
-        self.manager = ThreadPoolManager(max_workers=2)
-        self.manager.register_handler("text", text_handler)
-        self.manager.register_handler("math", math_handler)
+        """Isolate the tests from responses left over by a previous one."""
+        self._drain()
 
-    def tearDown(self):
-        """Shut down the thread pool after each test."""
-        self.manager.shutdown()
+    def _drain(self) -> None:
+        """Pop all the pending responses without blocking."""
+        while self.manager.get_response(timeout=0) is not None:
+            pass
 
     def test_register_handler(self):
         """Test that handlers can be correctly registered."""
@@ -36,6 +60,7 @@ class TestThreadPoolManager(unittest.TestCase):
             return data
 
         self.manager.register_handler("dummy", dummy_handler)
+        self.addCleanup(self.manager.handlers.pop, "dummy")
         self.assertIn("dummy", self.manager.handlers)
         self.assertEqual(self.manager.handlers["dummy"], dummy_handler)
 
@@ -61,29 +86,26 @@ class TestThreadPoolManager(unittest.TestCase):
 
     def test_multiple_requests(self):
         """Test handling multiple requests concurrently."""
-        requests = [
-            {"type": "text", "data": "hello"},
-            {"type": "math", "data": {"x": 2, "y": 3}},
-            {"type": "text", "data": "world"},
-        ]
-        for request in requests:
-            self.manager.submit_task(request)
-
-        results = []
-        for _ in range(len(requests)):
-            response = self.manager.get_response(timeout=5)
-            results.append(response)
+        for request in REQUESTS:
+            self.manager.submit_task(dict(request))
+
+        # Workers may finish out of order, compare the responses in task id order
+        results = sorted(self.manager.get_responses(len(REQUESTS), timeout=5), key=lambda response: response["id"])
 
         # Verify results
-        self.assertEqual(len(results), 3)
-        expected_results = [
-            {"result": "HELLO"},
-            {"result": 5},
-            {"result": "WORLD"},
-        ]
-        for result, expected in zip(results, expected_results):
+        self.assertEqual(len(results), len(EXPECTED))
+        for result, expected in zip(results, EXPECTED):
             self.assertEqual(result["result"], expected["result"])
 
+    def test_single_request(self):
+        """Test each request on its own, every case is reported independently."""
+        for request, expected in zip(REQUESTS, EXPECTED):
+            with self.subTest(request=request):
+                self.manager.submit_task(dict(request))
+                response = self.manager.get_response(timeout=5)
+                self.assertIsNotNone(response)
+                self.assertEqual(response["result"], expected["result"])
+
     def test_empty_response(self):
         """Test handling of empty response queue."""
         response = self.manager.get_response(timeout=1)
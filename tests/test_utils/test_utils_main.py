@@ -4,12 +4,28 @@
 Description: Test Cases Main Used to Run All Test Cases.
 """
 
+import importlib.util
 import os
+import sys
 import unittest
 
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+# pytest-xdist is only needed as a plugin, so probe for it instead of importing it
+if importlib.util.find_spec("xdist") is None:
+    pytest = None
+
 if __name__ == '__main__':
-    loader = unittest.TestLoader()
     current_dir = os.path.dirname(__file__)
-    suite = loader.discover(start_dir=current_dir, pattern='*.py', top_level_dir=current_dir)
+    # loadfile keeps the tests of one file on the same worker, so setUpClass runs only once per class
+    if pytest is not None:
+        sys.exit(pytest.main(["-n", "auto", "--dist=loadfile", current_dir]))
+
+    # Discover from the tests directory so test_utils is a package and shared helpers import relatively
+    loader = unittest.TestLoader()
+    suite = loader.discover(start_dir=current_dir, pattern='test_*.py', top_level_dir=os.path.dirname(current_dir))
     runner = unittest.TextTestRunner()
-    runner.run(suite)
+    sys.exit(not runner.run(suite).wasSuccessful())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Git Committer Grouped By Modified Time Test Cases.
+"""
+
+import os
+import unittest
+
+from utils.vcs.git.committer.git_committer_modify_time_grouped import ModifyTimeGroupedCommitter
+
+
+class TestModifyTimeGroupedCommitter(unittest.TestCase):
+    def test_should_include(self):
+        exclude_dirs = {os.path.normpath("dir2"), os.path.normpath("dir3/sub")}
+        matcher = ModifyTimeGroupedCommitter.compile_exclude_dirs(exclude_dirs)
+        self.assertNotIsInstance(matcher, frozenset)
+        self._check_should_include(matcher)
+
+    def test_should_include_with_many_exclude_dirs(self):
+        exclude_dirs = {os.path.normpath("dir2"), os.path.normpath("dir3/sub")}
+        exclude_dirs.update(f"other{i}" for i in range(ModifyTimeGroupedCommitter.EXCLUDE_DIRS_REGEX_MAX))
+        matcher = ModifyTimeGroupedCommitter.compile_exclude_dirs(exclude_dirs)
+        self.assertIsInstance(matcher, frozenset)
+        self._check_should_include(matcher)
+
+    def _check_should_include(self, matcher):
+        exclude_files = frozenset(["a.txt", "dir1/b.txt"])
+        self.assertFalse(ModifyTimeGroupedCommitter.should_include("a.txt", exclude_files, matcher))
+        self.assertFalse(ModifyTimeGroupedCommitter.should_include("dir1/b.txt", exclude_files, matcher))
+        self.assertFalse(ModifyTimeGroupedCommitter.should_include("dir2/c.txt", exclude_files, matcher))
+        self.assertFalse(ModifyTimeGroupedCommitter.should_include("dir2/x/c.txt", exclude_files, matcher))
+        self.assertFalse(ModifyTimeGroupedCommitter.should_include("dir3/sub/c.txt", exclude_files, matcher))
+
+        self.assertTrue(ModifyTimeGroupedCommitter.should_include("b.txt", exclude_files, matcher))
+        self.assertTrue(ModifyTimeGroupedCommitter.should_include("dir1/a.txt", exclude_files, matcher))
+        self.assertTrue(ModifyTimeGroupedCommitter.should_include("dir2.txt", exclude_files, matcher))
+        self.assertTrue(ModifyTimeGroupedCommitter.should_include("dir22/c.txt", exclude_files, matcher))
+        self.assertTrue(ModifyTimeGroupedCommitter.should_include("dir3/c.txt", exclude_files, matcher))
+
+    def test_should_include_without_exclusions(self):
+        pattern = ModifyTimeGroupedCommitter.compile_exclude_dirs(set())
+        self.assertIsNone(pattern)
+        self.assertTrue(ModifyTimeGroupedCommitter.should_include("a.txt", frozenset(), pattern))
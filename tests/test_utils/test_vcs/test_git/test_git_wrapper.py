@@ -4,33 +4,69 @@
 Description: File System Utility Class Test Cases.
 """
 
+import atexit
 import os
+import shutil
+import stat
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import git
 
 from utils.vcs.git.git_wrapper import GitWrapper
-from utils.codec.hash_util import HashUtil
 from utils.fs.fs_util import FsUtil
 
+# Removes the test data in the background, pending removals complete before the interpreter exits
+_trash_remover = ThreadPoolExecutor(max_workers=1)
+atexit.register(_trash_remover.shutdown, wait=True)
+
+
+def _dir_signature(path: str) -> int:
+    """ Signature of the files under the directory from (relative path, size, mtime), without reading any content """
+    entries = []
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    entries.append((os.path.relpath(entry.path, path), st.st_size, st.st_mtime_ns))
+    return hash(tuple(sorted(entries)))
+
 
 class TestGitBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Initialize a pristine repository once, every test copies it instead of running git init again
+        cls.pristine_git_template = os.path.join(tempfile.mkdtemp(prefix="git_template_"), "repo")
+        git.Repo.init(cls.pristine_git_template).close()
+        cls.pristine_git_template_signature = _dir_signature(cls.pristine_git_template)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(os.path.dirname(cls.pristine_git_template), ignore_errors=True)
+
     def setUp(self):
-        self.test_root_dir = os.path.join(FsUtil.get_current_project_root_path(), "tests")
-        self.test_data_root_dir = os.path.join(self.test_root_dir, "test_data")
-        self.test_class_data_root_dir = os.path.join(self.test_data_root_dir,
-                                                     "test_tool_sets", "test_bases", "test_git", "test_git_base")
+        # RAM-backed when TMPDIR points to a tmpfs such as /dev/shm, and outside the project working tree
+        self._tmp = tempfile.TemporaryDirectory(prefix="git_base_")
+        self.test_class_data_root_dir = self._tmp.name
 
     def tearDown(self):
-        FsUtil.force_remove(self.test_class_data_root_dir, not_exist_ok=True)
+        # Every test has its own temporary directory, nothing waits for the many small .git files to be unlinked
+        _trash_remover.submit(self._tmp.cleanup)
+
+    def copy_pristine_git_template(self, dst: str) -> None:
+        """ Hard links on POSIX cost no data copy, the tests must never modify files under .git """
+        copy_function = os.link if os.name == "posix" else shutil.copy2
+        shutil.copytree(self.pristine_git_template, dst, copy_function=copy_function)
 
     def test_clear_git_repository_except_metadata(self):
         test_data_dir = os.path.join(self.test_class_data_root_dir, "test_clear_git_repository_except_metadata")
-        FsUtil.remake_dirs(test_data_dir)
-
-        repo: git.Repo = git.Repo.init(test_data_dir)
-        repo.close()
-        hash_before: str = HashUtil.calculate_directory_hash(test_data_dir)
+        self.copy_pristine_git_template(test_data_dir)
+        signature_before: int = self.pristine_git_template_signature
         self.assertFalse(FsUtil.is_empty_dir(test_data_dir))
 
         file_path1: str = os.path.join(test_data_dir, "test_file.txt")
@@ -49,6 +85,22 @@ class TestGitBase(unittest.TestCase):
         self.assertFalse(os.path.exists(file_path1))
         self.assertFalse(os.path.exists(dir_path))
         self.assertFalse(os.path.exists(file_path2))
-        hash_after: str = HashUtil.calculate_directory_hash(test_data_dir)
-        self.assertEqual(hash_before, hash_after)
+        signature_after: int = _dir_signature(test_data_dir)
+        self.assertEqual(signature_before, signature_after)
+
+    def test_clear_git_repository_except_metadata_read_only(self):
+        test_data_dir = os.path.join(self.test_class_data_root_dir, "test_clear_read_only")
+        self.copy_pristine_git_template(test_data_dir)
+
+        # Read-only entries, as git leaves its pack files, must not stop the cleanup
+        file_path1: str = os.path.join(test_data_dir, "read_only.txt")
+        file_path2: str = os.path.join(test_data_dir, "read_only_dir", "read_only.txt")
+        FsUtil.create_files(test_data_dir, file_path1, file_path2)
+        os.chmod(file_path1, stat.S_IREAD)
+        os.chmod(file_path2, stat.S_IREAD)
+
+        GitWrapper.clear_git_repository_except_metadata(test_data_dir)
+        self.assertFalse(os.path.exists(file_path1))
+        self.assertFalse(os.path.exists(os.path.dirname(file_path2)))
+        self.assertEqual(_dir_signature(test_data_dir), self.pristine_git_template_signature)
 
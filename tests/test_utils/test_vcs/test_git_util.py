@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Git Utility Class Test Cases.
+"""
+
+import os
+import unittest
+
+import git
+
+from utils.fs.fs_util import FsUtil
+from utils.vcs.git_util import GitUtil, _read_untracked_files
+
+from ..base_test_case import TempDirTestBase
+
+
+class TestGitUtil(TempDirTestBase):
+    def setUp(self):
+        super().setUp()
+        self.repo_path = os.path.join(self.case_dir, "repo")
+        git.Repo.init(self.repo_path).close()
+
+    def test_is_git_repository(self):
+        self.assertTrue(GitUtil.is_git_repository(self.repo_path))
+        self.assertFalse(GitUtil.is_git_repository(self.case_dir))
+        self.assertFalse(GitUtil.is_git_repository(os.path.join(self.case_dir, "not_exist")))
+
+    def test_is_git_repository_bare(self):
+        bare_repo_path = os.path.join(self.case_dir, "bare")
+        git.Repo.init(bare_repo_path, bare=True).close()
+        self.assertTrue(GitUtil.is_git_repository(bare_repo_path))
+
+    def test_load_untracked_diff(self):
+        self.assertIsNone(GitUtil.load_untracked_diff(self.repo_path))
+
+        with open(os.path.join(self.repo_path, "a.txt"), "w", encoding="utf-8") as f:
+            f.write("hello")
+        diff = GitUtil.load_untracked_diff(self.repo_path, True)
+        self.assertIn("--- a.txt (untracked) ---", diff)
+        self.assertIn("hello", diff)
+
+    def test_load_untracked_diff_multiple_files(self):
+        file_names = [f"file_{i:02d}.txt" for i in range(20)]
+        for file_name in file_names:
+            with open(os.path.join(self.repo_path, file_name), "w", encoding="utf-8") as f:
+                f.write(f"content of {file_name}")
+        diff = GitUtil.load_untracked_diff(self.repo_path)
+        positions = [diff.index(f"--- {file_name} (untracked) ---") for file_name in file_names]
+        self.assertEqual(positions, sorted(positions))
+        for file_name in file_names:
+            self.assertIn(f"content of {file_name}", diff)
+
+    def test_load_untracked_diff_binary(self):
+        with open(os.path.join(self.repo_path, "b.bin"), "wb") as f:
+            f.write(b"\x00\x01\x02")
+        diff = GitUtil.load_untracked_diff(self.repo_path)
+        self.assertIn("--- b.bin (untracked, binary) ---", diff)
+
+    def test_load_tracked_diff(self):
+        file_path = os.path.join(self.repo_path, "a.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("hello\n")
+        repo = git.Repo(self.repo_path)
+        repo.git.add("a.txt")
+        repo.index.commit("init")
+        repo.close()
+        self.assertIsNone(GitUtil.load_tracked_diff(self.repo_path))
+        self.assertIsNone(GitUtil.export_diff_including_untracked(self.repo_path))
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("world\n")
+        diff = GitUtil.load_tracked_diff(self.repo_path, True)
+        self.assertTrue(diff.startswith("# Tracked File(s) Content"))
+        self.assertIn("+world", diff)
+        self.assertIn("+world", GitUtil.export_diff_including_untracked(self.repo_path))
+
+    def test_export_git_diff(self):
+        file_path = os.path.join(self.repo_path, "a.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("hello\n")
+        repo = git.Repo(self.repo_path)
+        repo.git.add("a.txt")
+        repo.index.commit("init")
+        repo.close()
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("staged\n")
+        self.assertTrue(GitUtil.add_files_to_stage(self.repo_path))
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("unstaged\n")
+
+        output_path = os.path.join(self.case_dir, "diff.txt")
+        GitUtil.export_git_diff(self.repo_path, output_path)
+        with open(output_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        staged_pos = content.index("### Staged Changes ###")
+        unstaged_pos = content.index("### Unstaged Changes ###")
+        self.assertLess(staged_pos, unstaged_pos)
+        self.assertIn("+staged", content[staged_pos:unstaged_pos])
+        self.assertIn("+unstaged", content[unstaged_pos:])
+
+    def test_get_last_commit_info(self):
+        with open(os.path.join(self.repo_path, "a.txt"), "w", encoding="utf-8") as f:
+            f.write("hello")
+        repo = git.Repo(self.repo_path)
+        repo.git.add("a.txt")
+        commit = repo.index.commit("init")
+        repo.close()
+
+        commit_id, commit_date, commit_time = GitUtil.get_last_commit_info(self.repo_path)
+        self.assertEqual(commit_id, commit.hexsha)
+        self.assertRegex(commit_date, r"^\d{4}-\d{2}-\d{2}$")
+        self.assertRegex(commit_time, r"^\d{14}$")
+        self.assertEqual(commit_date.replace("-", ""), commit_time[:8])
+        self.assertEqual(GitUtil.get_git_last_commit_id(self.repo_path), commit_id)
+
+    def test_add_files_to_stage_with_exclusions(self):
+        FsUtil.create_files(self.repo_path, "a.txt", "b.txt", os.path.join("dir", "c.txt"))
+        self.assertTrue(GitUtil.add_files_to_stage(self.repo_path, ["dir"], ["b.txt"]))
+        with git.Repo(self.repo_path) as repo:
+            staged = sorted(path for path, _ in repo.index.entries.keys())
+        self.assertEqual(staged, ["a.txt"])
+
+    def test_read_untracked_files(self):
+        files = ["a.txt", "empty.txt", "big.txt", "binary.bin"]
+        contents = [b"hello", b"", b"0123456789" * 20000, b"\x00\x01binary"]
+        for file, content in zip(files, contents):
+            with open(os.path.join(self.repo_path, file), "wb") as f:
+                f.write(content)
+
+        self.assertEqual(_read_untracked_files(self.repo_path, files),
+                         [("a.txt", "hello"), ("empty.txt", ""), ("big.txt", "0123456789" * 20000),
+                          ("binary.bin", None)])
+
+    def test_read_untracked_files_newlines(self):
+        # Same translation as the text-mode read used before, CRLF and CR become LF
+        with open(os.path.join(self.repo_path, "crlf.txt"), "wb") as f:
+            f.write(b"a\r\nb\r\n")
+        with open(os.path.join(self.repo_path, "cr.txt"), "wb") as f:
+            f.write(b"a\rb\r")
+        self.assertEqual(_read_untracked_files(self.repo_path, ["crlf.txt", "cr.txt"]),
+                         [("crlf.txt", "a\nb\n"), ("cr.txt", "a\nb\n")])
+        self.assertIn("--- crlf.txt (untracked) ---\r\na\nb\n", GitUtil.load_untracked_diff(self.repo_path))
+
+    def test_untracked_diff_fresh_after_modification(self):
+        file_path = os.path.join(self.repo_path, "a.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("hello")
+        self.assertIn("hello", GitUtil.load_untracked_diff(self.repo_path))
+
+        # Content change only, the top-level directory mtime is untouched, the diff must still be fresh
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("world")
+        diff = GitUtil.load_untracked_diff(self.repo_path)
+        self.assertIn("world", diff)
+        self.assertNotIn("hello", diff)
+
+        # Staged files are no longer untracked
+        self.assertTrue(GitUtil.add_files_to_stage(self.repo_path))
+        self.assertIsNone(GitUtil.load_untracked_diff(self.repo_path))
+
+    def test_untracked_diff_fresh_with_same_size_and_mtime(self):
+        file_path = os.path.join(self.repo_path, "a.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("hello")
+        self.assertIn("hello", GitUtil.load_untracked_diff(self.repo_path))
+
+        # A racily-clean rewrite keeps size and mtime, the content must still be read again
+        stat = os.stat(file_path)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("world")
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        diff = GitUtil.load_untracked_diff(self.repo_path)
+        self.assertIn("world", diff)
+        self.assertNotIn("hello", diff)
+        self.assertFalse(os.path.exists(os.path.join(self.repo_path, ".git", "tm18_status_cache")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Description: Windows Credential Manager Class Test Cases, against fake pywin32 and advapi32 bindings.
+"""
+
+import ctypes
+import importlib
+import sys
+import types
+import unittest
+from unittest import mock
+
+ERROR_NOT_FOUND = 1168
+
+
+class _PyWinError(Exception):
+    """Stands in for pywintypes.error."""
+
+    def __init__(self, winerror, funcname="", strerror=""):
+        super().__init__(winerror, funcname, strerror)
+        self.winerror = winerror
+
+
+class _FakeVault:
+    """In-memory credential vault exposing the win32cred functions used by the manager."""
+
+    def __init__(self):
+        self.credentials = {}
+        self.CredRead = mock.Mock(side_effect=self._read)
+        self.CredEnumerate = mock.Mock(side_effect=self._enumerate)
+        self.CredWrite = mock.Mock(side_effect=self._write)
+        self.CredDelete = mock.Mock(side_effect=self._delete)
+
+    def add(self, target, username, password, cred_type=1):
+        self.credentials[target.upper()] = {
+            "TargetName": target, "UserName": username, "Type": cred_type, "Persist": 2,
+            "CredentialBlob": password.encode("utf-16-le"),
+        }
+
+    def _read(self, target, cred_type, flags):
+        cred = self.credentials.get(target.upper())
+        if cred is None:
+            raise _PyWinError(ERROR_NOT_FOUND, "CredRead", "Element not found.")
+        return dict(cred)
+
+    def _enumerate(self, target_filter, flags):
+        prefix = target_filter[:-1].upper() if target_filter else ""
+        matches = [dict(cred) for key, cred in self.credentials.items() if key.startswith(prefix)]
+        if not matches:
+            raise _PyWinError(ERROR_NOT_FOUND, "CredEnumerate", "Element not found.")
+        return matches
+
+    def _write(self, credential, flags):
+        self.add(credential["TargetName"], credential["UserName"], bytes(credential["CredentialBlob"]).decode(
+            "utf-16-le"), credential["Type"])
+
+    def _delete(self, target, cred_type, flags):
+        if self.credentials.pop(target.upper(), None) is None:
+            raise _PyWinError(ERROR_NOT_FOUND, "CredDelete", "Element not found.")
+
+
+def _load_module(vault: _FakeVault, cred_write_w=None):
+    """
+    Import win_credential_mgr against fake pywin32 modules, advapi32!CredWriteW is faked when cred_write_w is given.
+    """
+    win32cred = types.ModuleType("win32cred")
+    win32cred.CRED_TYPE_GENERIC = 1
+    win32cred.CRED_PERSIST_LOCAL_MACHINE = 2
+    for name in ("CredRead", "CredEnumerate", "CredWrite", "CredDelete"):
+        setattr(win32cred, name, getattr(vault, name))
+    pywintypes = types.ModuleType("pywintypes")
+    pywintypes.error = _PyWinError
+    win32wnet = types.ModuleType("win32wnet")
+    win32wnet.WNetCancelConnection2 = mock.Mock()
+
+    patches = [mock.patch.dict(sys.modules, {"win32cred": win32cred, "pywintypes": pywintypes,
+                                             "win32wnet": win32wnet})]
+    if cred_write_w is not None:
+        patches.append(mock.patch.object(ctypes, "WinDLL", create=True,
+                                         return_value=mock.Mock(CredWriteW=cred_write_w)))
+    for patch in patches:
+        patch.start()
+    try:
+        sys.modules.pop("utils.win_credential_mgr", None)
+        return importlib.import_module("utils.win_credential_mgr")
+    finally:
+        for patch in reversed(patches):
+            patch.stop()
+
+
+class TestWindowsCredentialManager(unittest.TestCase):
+    def setUp(self):
+        self.vault = _FakeVault()
+        self.module = _load_module(self.vault)
+        self.manager = self.module.WindowsCredentialManager()
+        self.cancel_connection = self.module.win32wnet.WNetCancelConnection2
+
+    def test_bulk_upsert_resets_each_target_once(self):
+        entries = [("\\\\srv", "u1", "p1"), ("\\\\other", "u2", "p2"), ("\\\\srv", "u3", "p3")]
+        self.manager.bulk_upsert(entries)
+        self.assertEqual([c.args[0] for c in self.cancel_connection.call_args_list], ["\\\\srv", "\\\\other"])
+        self.assertEqual(self.vault.CredWrite.call_count, 3)
+        self.assertEqual(self.manager.get_credential("\\\\srv").UserName, "u3")
+
+    def test_bulk_delete_resets_each_target_once(self):
+        self.vault.add("\\\\srv", "u", "p")
+        self.manager.bulk_delete(["\\\\srv", "\\\\missing", "\\\\srv"])
+        self.assertEqual([c.args[0] for c in self.cancel_connection.call_args_list], ["\\\\srv", "\\\\missing"])
+        self.assertEqual(self.vault.CredDelete.call_count, 3)
+        self.assertIsNone(self.manager.get_credential("\\\\srv"))
+
+    def test_list_cache_invalidated_by_writes(self):
+        self.vault.add("\\\\srv\\a", "u", "p")
+        self.assertEqual([c.TargetName for c in self.manager.list_credentials()], ["\\\\srv\\a"])
+        self.manager.list_credentials()
+        self.assertEqual(self.vault.CredEnumerate.call_count, 1)
+
+        self.manager.add_or_update_credential("\\\\srv\\b", "u", "p", reset_smb_session=False)
+        self.assertEqual(len(self.manager.list_credentials()), 2)
+        self.assertEqual(self.vault.CredEnumerate.call_count, 2)
+
+        self.manager.delete_credential("\\\\srv\\a", reset_smb_session=False)
+        self.assertEqual([c.TargetName for c in self.manager.list_credentials()], ["\\\\srv\\b"])
+        self.assertEqual(self.vault.CredEnumerate.call_count, 3)
+
+    def test_list_cache_expires(self):
+        self.vault.add("\\\\srv", "u", "p")
+        self.manager.list_credentials()
+        with mock.patch.object(self.module.time, "monotonic",
+                               return_value=self.manager._cache[0] + self.manager.LIST_CACHE_TTL_SEC):
+            self.manager.list_credentials()
+        self.assertEqual(self.vault.CredEnumerate.call_count, 2)
+
+    def test_get_credentials_case_insensitive(self):
+        self.vault.add("\\\\Srv\\A", "u", "secret")
+        self.vault.add("\\\\Other", "u", "other")
+        result = self.manager.get_credentials(["\\\\srv\\a", "\\\\SRV\\A", "\\\\srv\\missing"])
+        self.assertEqual(result["\\\\srv\\a"].Password, "secret")
+        self.assertEqual(result["\\\\SRV\\A"].Password, "secret")
+        self.assertIsNone(result["\\\\srv\\missing"])
+        # One enumeration, filtered by the folded common prefix
+        self.vault.CredEnumerate.assert_called_once_with("\\\\SRV\\*", 0)
+
+    def test_get_credentials_not_found(self):
+        self.assertEqual(self.manager.get_credentials(["\\\\srv"]), {"\\\\srv": None})
+        self.assertEqual(self.manager.get_credentials([]), {})
+
+    def test_fold_target_keeps_length(self):
+        for target in ("\\\\straße", "\\\\İstanbul", "\\\\srv"):
+            with self.subTest(target=target):
+                self.assertEqual(len(self.module.WindowsCredentialManager._fold_target(target)), len(target))
+
+    def test_find_by_prefix_case_insensitive(self):
+        self.vault.add("\\\\Srv\\a", "u", "p")
+        self.vault.add("\\\\other", "u", "p")
+        self.assertEqual([c.TargetName for c in self.manager.find_by_prefix("\\\\srv")], ["\\\\Srv\\a"])
+
+    def test_get_credential(self):
+        self.vault.add("\\\\srv", "u", "p")
+        record = self.manager.get_credential("\\\\srv")
+        self.assertEqual(record.Password, "p")
+        # Dict-style access of the former results keeps working
+        self.assertEqual(record["Password"], "p")
+        self.assertEqual(record.get("UserName"), "u")
+        self.assertIsNone(record.get("Comment"))
+        self.assertIsNone(self.manager.get_credential("\\\\missing"))
+
+        self.vault.CredRead.side_effect = _PyWinError(5, "CredRead", "Access is denied.")
+        with self.assertRaises(_PyWinError):
+            self.manager.get_credential("\\\\srv")
+
+
+class TestWindowsCredentialManagerCredWriteW(unittest.TestCase):
+    def setUp(self):
+        self.written = []
+        self.cred_write_w = mock.Mock(side_effect=self._cred_write_w)
+        self.vault = _FakeVault()
+        self.module = _load_module(self.vault, self.cred_write_w)
+        self.manager = self.module.WindowsCredentialManager()
+
+    def _cred_write_w(self, credential_ref, flags):
+        credential = credential_ref._obj
+        self.written.append((credential.TargetName, credential.UserName,
+                             ctypes.string_at(credential.CredentialBlob, credential.CredentialBlobSize)))
+        return 1
+
+    def test_write_through_cred_write_w(self):
+        self.manager.add_or_update_credential("\\\\srv", "user", "pw", reset_smb_session=False)
+        self.assertEqual(self.written, [("\\\\srv", "user", "pw".encode("utf-16-le"))])
+        self.vault.CredWrite.assert_not_called()
+
+    def test_write_failure(self):
+        self.cred_write_w.side_effect = None
+        self.cred_write_w.return_value = 0
+        with mock.patch.object(ctypes, "get_last_error", create=True, return_value=5), \
+                mock.patch.object(ctypes, "FormatError", create=True, return_value="Access is denied."):
+            with self.assertRaises(_PyWinError) as context:
+                self.manager.add_or_update_credential("\\\\srv", "user", "pw", reset_smb_session=False)
+        self.assertEqual(context.exception.winerror, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()